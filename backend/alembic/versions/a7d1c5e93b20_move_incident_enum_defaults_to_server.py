@@ -0,0 +1,43 @@
+"""Move incident enum column defaults to the server
+
+Revision ID: a7d1c5e93b20
+Revises: f2a9d47b6c18
+Create Date: 2026-10-15 15:37:42.218805
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d1c5e93b20'
+down_revision: Union[str, Sequence[str], None] = 'f2a9d47b6c18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# column → default label (enum labels are the Python member names)
+_DEFAULTS = {
+    'status': 'OPEN',
+    'impact': 'MEDIUM',
+    'urgency': 'MEDIUM',
+    'priority': 'P3',
+    'source': 'PORTAL',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not sa.inspect(op.get_bind()).has_table('incidents'):
+        return
+    for column, label in _DEFAULTS.items():
+        op.alter_column('incidents', column, server_default=label)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not sa.inspect(op.get_bind()).has_table('incidents'):
+        return
+    for column in _DEFAULTS:
+        op.alter_column('incidents', column, server_default=None)
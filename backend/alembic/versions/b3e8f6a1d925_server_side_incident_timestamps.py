@@ -0,0 +1,40 @@
+"""Default incident timestamps to now() on the server
+
+Revision ID: b3e8f6a1d925
+Revises: a7d1c5e93b20
+Create Date: 2026-10-15 16:02:15.940371
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e8f6a1d925'
+down_revision: Union[str, Sequence[str], None] = 'a7d1c5e93b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = (
+    ('incidents', 'created_at'),
+    ('incidents', 'updated_at'),
+    ('incident_attachments', 'created_at'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not sa.inspect(op.get_bind()).has_table('incidents'):
+        return
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not sa.inspect(op.get_bind()).has_table('incidents'):
+        return
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=None)
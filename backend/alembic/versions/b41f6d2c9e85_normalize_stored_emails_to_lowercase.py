@@ -0,0 +1,36 @@
+"""Normalize stored emails to lowercase
+
+Revision ID: b41f6d2c9e85
+Revises: 7a160b943233
+Create Date: 2026-10-15 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41f6d2c9e85'
+down_revision: Union[str, Sequence[str], None] = '7a160b943233'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Emails are now lowercased at the API boundary and compared verbatim.
+    # Fails on users.email unique index if two accounts differ only by case,
+    # which must be merged by hand before upgrading.
+    op.execute("UPDATE users SET email = LOWER(email) WHERE email <> LOWER(email)")
+    op.execute("UPDATE invitations SET email = LOWER(email) WHERE email <> LOWER(email)")
+    op.execute(
+        "UPDATE auth_magic_link_tokens SET email = LOWER(email) "
+        "WHERE email <> LOWER(email)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Original casing is not recoverable; lowercase emails remain valid.
+    pass
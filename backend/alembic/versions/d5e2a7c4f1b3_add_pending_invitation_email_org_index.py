@@ -0,0 +1,39 @@
+"""Add partial index for pending invitations by email and organization
+
+Revision ID: d5e2a7c4f1b3
+Revises: b41f6d2c9e85
+Create Date: 2026-10-15 11:04:27.530917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e2a7c4f1b3'
+down_revision: Union[str, Sequence[str], None] = 'b41f6d2c9e85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_invitations_email_org_pending',
+        'invitations',
+        ['email', 'organization_id'],
+        unique=False,
+        postgresql_where=sa.text('accepted_at IS NULL'),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_invitations_email_org_pending',
+        table_name='invitations',
+        postgresql_where=sa.text('accepted_at IS NULL'),
+    )
@@ -0,0 +1,40 @@
+"""Make the incident service_id index partial
+
+Revision ID: d9b2e4f7a361
+Revises: c6f4a2b8e137
+Create Date: 2026-10-15 18:12:33.571904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9b2e4f7a361'
+down_revision: Union[str, Sequence[str], None] = 'c6f4a2b8e137'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not sa.inspect(op.get_bind()).has_table('incidents'):
+        return
+    op.drop_index('ix_incidents_service_id', table_name='incidents', if_exists=True)
+    op.create_index(
+        'ix_incidents_service_id',
+        'incidents',
+        ['service_id'],
+        unique=False,
+        postgresql_where=sa.text('service_id IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not sa.inspect(op.get_bind()).has_table('incidents'):
+        return
+    op.drop_index('ix_incidents_service_id', table_name='incidents')
+    op.create_index('ix_incidents_service_id', 'incidents', ['service_id'], unique=False)
@@ -0,0 +1,45 @@
+"""Add per-organization incident number counters
+
+Revision ID: e8c3f19a2d64
+Revises: d5e2a7c4f1b3
+Create Date: 2026-10-15 14:22:51.108344
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8c3f19a2d64'
+down_revision: Union[str, Sequence[str], None] = 'd5e2a7c4f1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # init_db's create_all creates and seeds the table on its own
+    if sa.inspect(op.get_bind()).has_table('incident_counters'):
+        return
+    op.create_table(
+        'incident_counters',
+        sa.Column('organization_id', sa.Uuid(), nullable=False),
+        sa.Column('last_number', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('organization_id'),
+    )
+    # Continue numbering from the existing per-org incident counts
+    if sa.inspect(op.get_bind()).has_table('incidents'):
+        op.execute(
+            """
+            INSERT INTO incident_counters (organization_id, last_number)
+            SELECT organization_id, count(*) FROM incidents GROUP BY organization_id
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('incident_counters')
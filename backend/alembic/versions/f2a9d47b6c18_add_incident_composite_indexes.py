@@ -0,0 +1,55 @@
+"""Add composite incident indexes for list and stats queries
+
+Revision ID: f2a9d47b6c18
+Revises: e8c3f19a2d64
+Create Date: 2026-10-15 14:51:09.664120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a9d47b6c18'
+down_revision: Union[str, Sequence[str], None] = 'e8c3f19a2d64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The incidents table is created by init_db on fresh databases; on
+    # upgraded ones init_db's create_all may already have added these indexes
+    if not sa.inspect(op.get_bind()).has_table('incidents'):
+        return
+    op.create_index(
+        'ix_incidents_org_created',
+        'incidents',
+        ['organization_id', sa.text('created_at DESC')],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.create_index('ix_incidents_org_status', 'incidents', ['organization_id', 'status'], unique=False, if_not_exists=True)
+    op.create_index('ix_incidents_org_assigned', 'incidents', ['organization_id', 'assigned_to'], unique=False, if_not_exists=True)
+    op.create_index(
+        'ix_incidents_org_priority_status',
+        'incidents',
+        ['organization_id', 'priority', 'status'],
+        unique=False,
+        if_not_exists=True,
+    )
+    # Leading column of every composite above
+    op.drop_index('ix_incidents_organization_id', table_name='incidents', if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not sa.inspect(op.get_bind()).has_table('incidents'):
+        return
+    op.create_index('ix_incidents_organization_id', 'incidents', ['organization_id'], unique=False)
+    op.drop_index('ix_incidents_org_priority_status', table_name='incidents')
+    op.drop_index('ix_incidents_org_assigned', table_name='incidents')
+    op.drop_index('ix_incidents_org_status', table_name='incidents')
+    op.drop_index('ix_incidents_org_created', table_name='incidents')
@@ -7,7 +7,7 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 
-from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, text
 from sqlalchemy import Enum as SAEnum
 from sqlmodel import Field, SQLModel
 
@@ -40,6 +40,16 @@ class Invitation(SQLModel, table=True):
     """
 
     __tablename__ = "invitations"
+    __table_args__ = (
+        # Partial index for the pending-invite check on create_invite
+        # (email + org, unaccepted only); stays small as invites are accepted.
+        Index(
+            "ix_invitations_email_org_pending",
+            "email",
+            "organization_id",
+            postgresql_where=text("accepted_at IS NULL"),
+        ),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     organization_id: uuid.UUID = Field(
@@ -21,6 +21,11 @@ class OrgRole(str, Enum):
     VIEWER = "viewer"  # Read-only access for stakeholders
 
 
+# Plain-dict role → string lookup for per-row response building
+# (cheaper than the Enum .value descriptor in list comprehensions)
+ORG_ROLE_VALUES: dict[OrgRole, str] = {role: role.value for role in OrgRole}
+
+
 class UserOrganization(SQLModel, table=True):
     """
     Join table for User ↔ Organization many-to-many relationship.
@@ -7,6 +7,8 @@ import uuid
 from datetime import datetime, timezone
 
 from sqlalchemy import Column, DateTime
+from sqlalchemy.ext.hybrid import hybrid_property
+from pydantic import ConfigDict
 from sqlmodel import Field, SQLModel
 
 
@@ -34,6 +36,7 @@ class User(UserBase, table=True):
     """
 
     __tablename__ = "users"
+    model_config = ConfigDict(ignored_types=(hybrid_property,))
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     hashed_password: str = Field(max_length=255)
@@ -54,3 +57,12 @@ class User(UserBase, table=True):
         sa_column=Column(DateTime(timezone=True), nullable=True)
     )
 
+    @hybrid_property
+    def has_usable_password(self) -> bool:
+        """False for passwordless accounts ("!" / empty marker hash)."""
+        return bool(self.hashed_password and self.hashed_password != "!")
+
+    @has_usable_password.inplace.expression
+    @classmethod
+    def _has_usable_password_expression(cls):
+        return cls.hashed_password.not_in(["", "!"])
@@ -5,10 +5,14 @@ Invitation repository for data access operations.
 import uuid
 from datetime import datetime, timezone
 
+from sqlalchemy import Row, func, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from app.auth.models.invitation import Invitation
+from app.auth.models.membership import UserOrganization
+from app.auth.models.organization import Organization
+from app.auth.models.user import User
 
 
 class InvitationRepository:
@@ -18,11 +22,19 @@ class InvitationRepository:
         self.session = session
 
     async def create(self, invitation: Invitation) -> Invitation:
-        """Create a new invitation."""
-        self.session.add(invitation)
+        """Create a new invitation (INSERT ... RETURNING, no follow-up SELECT)."""
+        statement = (
+            insert(Invitation)
+            .values(**invitation.model_dump(exclude_none=True))
+            .returning(Invitation)
+        )
+        result = await self.session.execute(statement)
+        return result.scalar_one()
+
+    async def create_many(self, invitations: list[Invitation]) -> None:
+        """Create several invitations in a single batched INSERT."""
+        self.session.add_all(invitations)
         await self.session.flush()
-        await self.session.refresh(invitation)
-        return invitation
 
     async def get_by_token(self, token: str) -> Invitation | None:
         """Find an invitation by its token."""
@@ -30,6 +42,31 @@ class InvitationRepository:
         result = await self.session.execute(statement)
         return result.scalar_one_or_none()
 
+    async def get_by_token_with_org(
+        self, token: str, *, require_valid: bool = False
+    ) -> tuple[Invitation | None, Organization | None]:
+        """
+        Find an invitation by its token together with its organization.
+
+        With require_valid, accepted or expired invitations are filtered out
+        in SQL and come back as (None, None).
+        """
+        statement = (
+            select(Invitation, Organization)
+            .outerjoin(Organization, Organization.id == Invitation.organization_id)
+            .where(Invitation.token == token)
+        )
+        if require_valid:
+            statement = statement.where(
+                Invitation.accepted_at.is_(None),
+                Invitation.expires_at >= func.now(),
+            )
+        result = await self.session.execute(statement)
+        row = result.first()
+        if row is None:
+            return None, None
+        return row[0], row[1]
+
     async def get_by_id(self, invite_id: uuid.UUID) -> Invitation | None:
         """Find an invitation by ID."""
         statement = select(Invitation).where(Invitation.id == invite_id)
@@ -48,14 +85,54 @@ class InvitationRepository:
         result = await self.session.execute(statement)
         return result.scalar_one_or_none()
 
-    async def get_pending_by_org(self, org_id: uuid.UUID) -> list[Invitation]:
-        """Get all pending invitations for an organization."""
-        statement = select(Invitation).where(
+    async def preflight_checks(self, email: str, org_id: uuid.UUID) -> Row:
+        """
+        Pre-insert checks for a new invite, in one round trip.
+
+        Returns a row with `is_member` (the email already belongs to a member)
+        and `has_pending_invite` (an unaccepted invite already exists).
+        """
+        is_member = (
+            select(UserOrganization.id)
+            .join(User, User.id == UserOrganization.user_id)
+            .where(User.email == email, UserOrganization.organization_id == org_id)
+            .exists()
+        )
+        has_pending_invite = (
+            select(Invitation.id)
+            .where(
+                Invitation.email == email,
+                Invitation.organization_id == org_id,
+                Invitation.accepted_at.is_(None),
+            )
+            .exists()
+        )
+        statement = select(
+            is_member.label("is_member"),
+            has_pending_invite.label("has_pending_invite"),
+        )
+        result = await self.session.execute(statement)
+        return result.one()
+
+    async def get_pending_by_org(self, org_id: uuid.UUID) -> list[Row]:
+        """
+        Get all pending invitations for an organization.
+
+        Projects only the columns the invite list shows (id, email, role,
+        token, expires_at) — no ORM entities, no relationship loads.
+        """
+        statement = select(
+            Invitation.id,
+            Invitation.email,
+            Invitation.role,
+            Invitation.token,
+            Invitation.expires_at,
+        ).where(
             Invitation.organization_id == org_id,
             Invitation.accepted_at.is_(None),
         )
         result = await self.session.execute(statement)
-        return list(result.scalars().all())
+        return list(result.all())
 
     async def mark_accepted(self, invitation: Invitation) -> Invitation:
         """Mark an invitation as accepted."""
@@ -65,6 +142,28 @@ class InvitationRepository:
         await self.session.refresh(invitation)
         return invitation
 
+    async def accept_with_membership(
+        self, invitation: Invitation, membership: UserOrganization
+    ) -> None:
+        """
+        Create the invitee's membership and mark the invitation accepted
+        in one statement (INSERT in a CTE + UPDATE).
+        """
+        accepted_at = datetime.now(timezone.utc)
+        insert_membership = (
+            insert(UserOrganization)
+            .values(**membership.model_dump(exclude_none=True))
+            .cte("membership")
+        )
+        statement = (
+            update(Invitation)
+            .where(Invitation.id == invitation.id)
+            .values(accepted_at=accepted_at)
+            .add_cte(insert_membership)
+        )
+        await self.session.execute(statement)
+        invitation.accepted_at = accepted_at
+
     async def delete(self, invitation: Invitation) -> None:
         """Delete an invitation."""
         await self.session.delete(invitation)
@@ -4,8 +4,9 @@ Membership repository for user-organization relationships.
 
 import uuid
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
+from sqlmodel import and_, select
 
 from app.auth.models.membership import OrgRole, UserOrganization
 from app.auth.models.organization import Organization
@@ -18,11 +19,14 @@ class MembershipRepository:
         self.session = session
 
     async def create(self, membership: UserOrganization) -> UserOrganization:
-        """Create a new user-organization membership."""
-        self.session.add(membership)
-        await self.session.flush()
-        await self.session.refresh(membership)
-        return membership
+        """Create a new user-organization membership (INSERT ... RETURNING, no follow-up SELECT)."""
+        statement = (
+            insert(UserOrganization)
+            .values(**membership.model_dump(exclude_none=True))
+            .returning(UserOrganization)
+        )
+        result = await self.session.execute(statement)
+        return result.scalar_one()
 
     async def get_user_organizations(
         self, user_id: uuid.UUID
@@ -52,3 +56,34 @@ class MembershipRepository:
         """Check if a user is a member of an organization."""
         membership = await self.get_membership(user_id, org_id)
         return membership is not None
+
+    async def get_with_org_by_slug(
+        self, user_id: uuid.UUID, org_slug: str
+    ) -> tuple[Organization | None, UserOrganization | None]:
+        """
+        Resolve an organization by slug together with the user's membership.
+
+        One LEFT JOIN: (None, None) if the slug is unknown, (org, None) if
+        the user isn't a member. Rows come back detached from the session
+        (read-only snapshots), so callers may cache and share them.
+        """
+        statement = (
+            select(Organization, UserOrganization)
+            .outerjoin(
+                UserOrganization,
+                and_(
+                    UserOrganization.organization_id == Organization.id,
+                    UserOrganization.user_id == user_id,
+                ),
+            )
+            .where(Organization.slug == org_slug)
+        )
+        result = await self.session.execute(statement)
+        row = result.first()
+        if row is None:
+            return None, None
+        organization, membership = row
+        self.session.expunge(organization)
+        if membership is not None:
+            self.session.expunge(membership)
+        return organization, membership
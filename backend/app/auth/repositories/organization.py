@@ -4,9 +4,12 @@ Organization repository for data access operations.
 
 import uuid
 
+from sqlalchemy import or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from app.auth.models.invitation import Invitation
+from app.auth.models.membership import UserOrganization
 from app.auth.models.organization import Organization
 
 
@@ -23,11 +26,24 @@ class OrganizationRepository:
         await self.session.refresh(org)
         return org
 
+    async def create_with_owner(
+        self,
+        org: Organization,
+        owner: UserOrganization,
+        invitations: list[Invitation] | None = None,
+    ) -> Organization:
+        """
+        Persist an organization, its owner membership and initial invitations
+        in a single flush. IDs are client-generated, so no intermediate
+        round trips are needed to link the rows.
+        """
+        self.session.add_all([org, owner, *(invitations or [])])
+        await self.session.flush()
+        return org
+
     async def get_by_id(self, org_id: uuid.UUID) -> Organization | None:
-        """Find an organization by ID."""
-        statement = select(Organization).where(Organization.id == org_id)
-        result = await self.session.execute(statement)
-        return result.scalar_one_or_none()
+        """Find an organization by ID (identity-map hit skips the SELECT)."""
+        return await self.session.get(Organization, org_id)
 
     async def get_by_slug(self, slug: str) -> Organization | None:
         """Find an organization by its URL slug."""
@@ -42,9 +58,19 @@ class OrganizationRepository:
 
     async def generate_unique_slug(self, base_slug: str) -> str:
         """Generate a unique slug, appending -2, -3, etc. on collision."""
+        # Fetch the base slug and its "-N" variants in one round trip
+        statement = select(Organization.slug).where(
+            or_(
+                Organization.slug == base_slug,
+                Organization.slug.startswith(f"{base_slug}-", autoescape=True),
+            )
+        )
+        result = await self.session.execute(statement)
+        taken = set(result.scalars().all())
+
         slug = base_slug
         counter = 2
-        while await self.exists_by_slug(slug):
+        while slug in taken:
             slug = f"{base_slug}-{counter}"
             counter += 1
         return slug
@@ -11,8 +11,9 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
 
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select, col, func, delete
+from sqlmodel import select, col, delete
 
 from app.auth.models.token import RefreshToken, MagicLinkToken
 from app.auth.models.user import User
@@ -24,6 +25,7 @@ REFRESH_TOKEN_LIFETIME = timedelta(days=30)
 REFRESH_TOKEN_SESSION_LIFETIME = timedelta(hours=24)
 MAGIC_LINK_LIFETIME = timedelta(minutes=15)
 MAGIC_LINK_RATE_LIMIT = 3  # per minute per email
+MAGIC_LINK_RATE_WINDOW = timedelta(minutes=1)
 _LAST_USED_DEBOUNCE = timedelta(seconds=60)
 
 
@@ -144,7 +146,7 @@ class TokenRepository:
         if token_obj.is_revoked:
             await self.revoke_family(token_obj.token_family)
             # CRITICAL: commit the family revocation before raising,
-            # because get_session() rolls back on exception
+            # because get_db() rolls back on exception
             await self.session.commit()
             logger.warning(
                 f"Refresh token reuse detected for user {token_obj.user_id}, "
@@ -278,11 +280,13 @@ class TokenRepository:
 
     # ── Magic Link CRUD ───────────────────────────────────────────
 
-    async def count_recent_magic_links(self, email: str, since: datetime) -> int:
-        """Count recent magic links for rate limiting."""
+    async def count_recent_magic_links(
+        self, email: str, window: timedelta = MAGIC_LINK_RATE_WINDOW
+    ) -> int:
+        """Count magic links issued within the rate-limit window (database clock)."""
         stmt = select(func.count()).select_from(MagicLinkToken).where(
             MagicLinkToken.email == email,
-            MagicLinkToken.created_at >= since,
+            MagicLinkToken.created_at >= func.now() - window,
         )
         result = await self.session.execute(stmt)
         return result.scalar_one()
@@ -299,7 +303,7 @@ class TokenRepository:
         now = datetime.now(timezone.utc)
 
         token = MagicLinkToken(
-            email=email.lower().strip(),
+            email=email,
             token_hash=self._hash_token(raw_token),
             otp_hash=self._hash_token(raw_otp),
             expires_at=now + MAGIC_LINK_LIFETIME,
@@ -316,7 +320,7 @@ class TokenRepository:
         stmt = (
             select(MagicLinkToken)
             .where(
-                MagicLinkToken.email == email.lower().strip(),
+                MagicLinkToken.email == email,
                 MagicLinkToken.is_used == False,
                 MagicLinkToken.expires_at > now,
             )
@@ -4,10 +4,14 @@ Implements the Repository Pattern for data layer abstraction.
 """
 
 import uuid
+from datetime import datetime
 
+from sqlalchemy import Row, func, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from app.auth.models.token import RefreshToken
 from app.auth.models.user import User
 
 
@@ -21,11 +25,28 @@ class UserRepository:
         self.session = session
 
     async def create(self, user: User) -> User:
-        """Persist a new user to the database."""
-        self.session.add(user)
-        await self.session.flush()
-        await self.session.refresh(user)
-        return user
+        """Persist a new user to the database (INSERT ... RETURNING, no follow-up SELECT)."""
+        statement = (
+            insert(User)
+            .values(**user.model_dump(exclude_none=True))
+            .returning(User)
+        )
+        result = await self.session.execute(statement)
+        return result.scalar_one()
+
+    async def create_if_absent(self, user: User) -> User | None:
+        """
+        Insert a user unless the email is already registered.
+        Single race-free round trip; returns None on conflict.
+        """
+        statement = (
+            insert(User)
+            .values(**user.model_dump(exclude_none=True))
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User)
+        )
+        result = await self.session.execute(statement)
+        return result.scalar_one_or_none()
 
     async def get_by_id(self, user_id: uuid.UUID) -> User | None:
         """Find a user by their ID."""
@@ -33,6 +54,46 @@ class UserRepository:
         result = await self.session.execute(statement)
         return result.scalar_one_or_none()
 
+    async def get_email_with_membership(
+        self, user_id: uuid.UUID, org_id: uuid.UUID
+    ) -> Row | None:
+        """
+        Fetch a user's email and whether they already belong to an organization.
+
+        Returns a row with `email` and `is_member`, or None if the user doesn't exist.
+        """
+        from app.auth.models.membership import UserOrganization
+
+        is_member = (
+            select(UserOrganization.id)
+            .where(
+                UserOrganization.user_id == User.id,
+                UserOrganization.organization_id == org_id,
+            )
+            .exists()
+        )
+        statement = select(User.email, is_member.label("is_member")).where(
+            User.id == user_id
+        )
+        result = await self.session.execute(statement)
+        return result.one_or_none()
+
+    async def get_profile(self, user_id: uuid.UUID) -> Row | None:
+        """Fetch only the columns the profile view needs (no entity load)."""
+        statement = select(
+            User.id,
+            User.email,
+            User.first_name,
+            User.last_name,
+            User.avatar_url,
+            User.email_verified,
+            User.has_usable_password.label("has_usable_password"),
+            User.created_at,
+            User.last_login_at,
+        ).where(User.id == user_id)
+        result = await self.session.execute(statement)
+        return result.one_or_none()
+
     async def get_by_email(self, email: str) -> User | None:
         """Find a user by their email address."""
         statement = select(User).where(User.email == email)
@@ -52,6 +113,50 @@ class UserRepository:
         await self.session.refresh(user)
         return user
 
+    async def touch_login(
+        self, user_id: uuid.UUID, at: datetime, *, verify_email: bool = False
+    ) -> None:
+        """Record a login (and optionally verify the email) in one targeted UPDATE."""
+        values: dict = {"last_login_at": at}
+        if verify_email:
+            values["email_verified"] = True
+        statement = update(User).where(User.id == user_id).values(**values)
+        await self.session.execute(statement)
+
+    async def deactivate_and_revoke(
+        self, user_id: uuid.UUID, at: datetime
+    ) -> int | None:
+        """
+        Soft-delete a user and revoke their live refresh tokens in one statement.
+
+        Returns the number of sessions revoked, or None if the user doesn't exist.
+        """
+        deactivated = (
+            update(User)
+            .where(User.id == user_id)
+            .values(is_active=False, deactivated_at=at)
+            .returning(User.id)
+            .cte("deactivated")
+        )
+        revoked = (
+            update(RefreshToken)
+            .where(
+                RefreshToken.user_id.in_(select(deactivated.c.id)),
+                RefreshToken.is_revoked == False,  # noqa: E712
+                RefreshToken.expires_at > at,
+            )
+            .values(is_revoked=True)
+            .returning(RefreshToken.id)
+            .cte("revoked")
+        )
+        statement = select(
+            select(func.count()).select_from(deactivated).scalar_subquery(),
+            select(func.count()).select_from(revoked).scalar_subquery(),
+        )
+        result = await self.session.execute(statement)
+        found, revoked_count = result.one()
+        return revoked_count if found else None
+
     async def delete(self, user: User) -> None:
         """Delete a user from the database."""
         await self.session.delete(user)
@@ -64,7 +169,7 @@ class UserRepository:
 
     async def get_user_organizations(self, user_id: uuid.UUID) -> list["OrganizationBrief"]:
         """Get brief info of all organizations a user belongs to."""
-        from app.auth.models.membership import UserOrganization
+        from app.auth.models.membership import ORG_ROLE_VALUES, UserOrganization
         from app.auth.models.organization import Organization
         from app.auth.schemas import OrganizationBrief
         
@@ -78,7 +183,10 @@ class UserRepository:
         result = await self.session.execute(statement)
         rows = result.all()
         
+        # Rows come straight from the DB; skip per-field validation
         return [
-            OrganizationBrief(id=row.id, name=row.name, slug=row.slug, role=row.role)
+            OrganizationBrief.model_construct(
+                id=row.id, name=row.name, slug=row.slug, role=ORG_ROLE_VALUES[row.role]
+            )
             for row in rows
         ]
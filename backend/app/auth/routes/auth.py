@@ -71,7 +71,7 @@ async def verify_magic_link(
         remember_me=data.remember_me,
     )
     organizations = await auth_service.user_repo.get_user_organizations(user.id)
-    return LoginResponse(
+    return LoginResponse.model_construct(
         access_token=access_token,
         refresh_token=refresh_token,
         organizations=organizations,
@@ -94,7 +94,7 @@ async def verify_otp(
         remember_me=data.remember_me,
     )
     organizations = await auth_service.user_repo.get_user_organizations(user.id)
-    return LoginResponse(
+    return LoginResponse.model_construct(
         access_token=access_token,
         refresh_token=refresh_token,
         organizations=organizations,
@@ -120,7 +120,7 @@ async def login_with_password(
         remember_me=data.remember_me,
     )
     organizations = await auth_service.user_repo.get_user_organizations(user.id)
-    return LoginResponse(
+    return LoginResponse.model_construct(
         access_token=access_token,
         refresh_token=refresh_token,
         organizations=organizations,
@@ -138,7 +138,9 @@ async def refresh_token(
     access_token, refresh_token, _ = await auth_service.refresh_token(
         data.refresh_token
     )
-    return TokenResponse(access_token=access_token, refresh_token=refresh_token)
+    return TokenResponse.model_construct(
+        access_token=access_token, refresh_token=refresh_token
+    )
 
 
 @router.post("/validate", response_model=ValidateResponse)
@@ -148,7 +150,7 @@ async def validate_session(
 ):
     """Check if a session is alive without rotating tokens."""
     valid = await auth_service.validate_session(data.refresh_token)
-    return ValidateResponse(valid=valid)
+    return ValidateResponse.model_construct(valid=valid)
 
 
 @router.post("/logout", response_model=MessageResponse)
@@ -166,11 +168,11 @@ async def logout(
 @router.get("/sessions", response_model=list[SessionResponse])
 async def list_sessions(
     request: Request,
-    user_id: str = Depends(get_current_user_id),
+    user_id: uuid.UUID = Depends(get_current_user_id),
     auth_service=Depends(get_auth_service),
 ):
     """List active sessions for the current user with is_current flag."""
-    sessions = await auth_service.get_active_sessions(uuid.UUID(user_id))
+    sessions = await auth_service.get_active_sessions(user_id)
 
     # Determine the current session by matching device+IP
     current_device = (request.headers.get("user-agent", "")[:255]).strip()
@@ -192,11 +194,11 @@ async def list_sessions(
 @router.delete("/sessions/{session_id}", response_model=MessageResponse)
 async def revoke_session(
     session_id: uuid.UUID,
-    user_id: str = Depends(get_current_user_id),
+    user_id: uuid.UUID = Depends(get_current_user_id),
     auth_service=Depends(get_auth_service),
 ):
     """Revoke a specific session for the current user."""
-    revoked = await auth_service.revoke_session(uuid.UUID(user_id), session_id)
+    revoked = await auth_service.revoke_session(user_id, session_id)
     if not revoked:
         from app.core.exceptions import NotFoundError
         raise NotFoundError("Session")
@@ -205,11 +207,11 @@ async def revoke_session(
 
 @router.post("/logout-all", response_model=MessageResponse)
 async def logout_all(
-    user_id: str = Depends(get_current_user_id),
+    user_id: uuid.UUID = Depends(get_current_user_id),
     auth_service=Depends(get_auth_service),
 ):
     """Revoke all active sessions for the current user."""
-    count = await auth_service.logout_all(uuid.UUID(user_id))
+    count = await auth_service.logout_all(user_id)
     return {"message": f"{count} sessions revoked"}
 
 
@@ -218,26 +220,26 @@ async def logout_all(
 
 @router.get("/me", response_model=UserResponse)
 async def get_me(
-    user_id: str = Depends(get_current_user_id),
+    user_id: uuid.UUID = Depends(get_current_user_id),
     auth_service=Depends(get_auth_service),
 ):
-    user = await auth_service.user_repo.get_by_id(uuid.UUID(user_id))
+    user = await auth_service.user_repo.get_by_id(user_id)
     return user
 
 
 @router.get("/organizations", response_model=list[OrganizationBrief])
 async def get_my_organizations(
-    user_id: str = Depends(get_current_user_id),
+    user_id: uuid.UUID = Depends(get_current_user_id),
     auth_service=Depends(get_auth_service),
 ):
     """List organizations the user belongs to."""
-    return await auth_service.user_repo.get_user_organizations(uuid.UUID(user_id))
+    return await auth_service.user_repo.get_user_organizations(user_id)
 
 
 @router.post("/organizations", response_model=OrganizationResponse, status_code=status.HTTP_201_CREATED)
 async def create_organization(
     data: CreateOrganizationRequest,
-    user_id: str = Depends(get_current_user_id),
+    user_id: uuid.UUID = Depends(get_current_user_id),
     invite_service=Depends(get_invite_service),
 ):
     """Create a new organization. The current user becomes the owner."""
@@ -253,16 +255,14 @@ async def create_organization(
         slug=slug,
         description=data.description,
     )
-    organization = await invite_service.org_repo.create(organization)
-
     membership = UserOrganization(
-        user_id=uuid.UUID(user_id),
+        user_id=user_id,
         organization_id=organization.id,
         role=OrgRole.OWNER,
     )
-    await invite_service.membership_repo.create(membership)
+    await invite_service.org_repo.create_with_owner(organization, membership)
 
-    return OrganizationResponse(
+    return OrganizationResponse.model_construct(
         id=organization.id,
         name=organization.name,
         slug=organization.slug,
@@ -276,32 +276,32 @@ async def create_organization(
 
 @router.get("/profile", response_model=ProfileResponse)
 async def get_profile(
-    user_id: str = Depends(get_current_user_id),
+    user_id: uuid.UUID = Depends(get_current_user_id),
     auth_service=Depends(get_auth_service),
 ):
     """Get full profile for account settings."""
-    return await auth_service.get_profile(uuid.UUID(user_id))
+    return await auth_service.get_profile(user_id)
 
 
 @router.patch("/profile", response_model=ProfileResponse)
 async def update_profile(
     data: UpdateProfileRequest,
-    user_id: str = Depends(get_current_user_id),
+    user_id: uuid.UUID = Depends(get_current_user_id),
     auth_service=Depends(get_auth_service),
 ):
     """Update user's display name."""
-    return await auth_service.update_profile(uuid.UUID(user_id), data.name)
+    return await auth_service.update_profile(user_id, data.name)
 
 
 @router.post("/profile/password", response_model=MessageResponse)
 async def set_password(
     data: SetPasswordRequest,
-    user_id: str = Depends(get_current_user_id),
+    user_id: uuid.UUID = Depends(get_current_user_id),
     auth_service=Depends(get_auth_service),
 ):
     """Set or change user password."""
     await auth_service.set_password(
-        user_id=uuid.UUID(user_id),
+        user_id=user_id,
         new_password=data.new_password,
         confirm_password=data.confirm_password,
         current_password=data.current_password,
@@ -311,10 +311,10 @@ async def set_password(
 
 @router.delete("/profile", response_model=MessageResponse)
 async def delete_account(
-    user_id: str = Depends(get_current_user_id),
+    user_id: uuid.UUID = Depends(get_current_user_id),
     auth_service=Depends(get_auth_service),
 ):
     """Soft-delete user account and revoke all sessions."""
-    await auth_service.delete_account(uuid.UUID(user_id))
+    await auth_service.delete_account(user_id)
     return {"message": "Account deleted"}
 
@@ -5,21 +5,21 @@ Organization-scoped routes for managing invitations.
 
 import uuid
 
-from fastapi import APIRouter, Depends, Request, status
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from fastapi import APIRouter, Depends, Request, Response, status
+from pydantic import TypeAdapter
 
 from app.core.dependencies import get_invite_service
 from app.core.organization import require_admin_or_owner, verify_organization_access
-from app.auth.models.membership import UserOrganization
+from app.core.rate_limit import limiter, org_scoped_key
+from app.auth.models.membership import ORG_ROLE_VALUES, UserOrganization
 from app.auth.models.organization import Organization
 from app.auth.schemas import InviteRequest, InviteResponse, MessageResponse
 from app.auth.services.invite import InviteService
 
 router = APIRouter(tags=["Invitations"])
 
-# Rate limiter
-limiter = Limiter(key_func=get_remote_address)
+# Built once; list_invites serializes through it directly
+_invite_list_adapter = TypeAdapter(list[InviteResponse])
 
 
 @router.post(
@@ -28,7 +28,7 @@ limiter = Limiter(key_func=get_remote_address)
     status_code=status.HTTP_201_CREATED,
     summary="Invite a user to organization",
 )
-@limiter.limit("10/minute")
+@limiter.limit("10/minute", key_func=org_scoped_key)
 async def create_invite(
     request: Request,
     organization_slug: str,
@@ -43,7 +43,8 @@ async def create_invite(
         invite_data=invite_data,
         inviter_id=membership.user_id,
     )
-    return InviteResponse(
+    # Trusted ORM data — skip per-field validation
+    return InviteResponse.model_construct(
         id=invitation.id,
         email=invitation.email,
         role=invitation.role.value,
@@ -61,20 +62,27 @@ async def list_invites(
     organization_slug: str,
     org_access: tuple[Organization, UserOrganization] = Depends(verify_organization_access),
     invite_service: InviteService = Depends(get_invite_service),
-) -> list[InviteResponse]:
+) -> Response:
     """List all pending invitations for the organization."""
     organization, membership = org_access
     invitations = await invite_service.list_pending_invites(org_id=organization.id)
-    return [
-        InviteResponse(
+    # Trusted ORM data — skip per-field validation
+    invites = [
+        InviteResponse.model_construct(
             id=inv.id,
             email=inv.email,
-            role=inv.role.value,
+            role=ORG_ROLE_VALUES[inv.role],
             token=inv.token,
             expires_at=inv.expires_at,
         )
         for inv in invitations
     ]
+    # Returning a Response bypasses FastAPI's response_model re-validation;
+    # response_model is kept for the OpenAPI schema
+    return Response(
+        content=_invite_list_adapter.dump_json(invites),
+        media_type="application/json",
+    )
 
 
 @router.delete(
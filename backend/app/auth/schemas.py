@@ -5,11 +5,16 @@ Separates API contracts from database models.
 
 import uuid
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import AfterValidator, BaseModel, EmailStr, Field
 
 from app.auth.models.membership import OrgRole
 
+# Emails are lowercased once at the API boundary and stored that way,
+# so services and repositories compare them as-is.
+NormalizedEmail = Annotated[EmailStr, AfterValidator(str.lower)]
+
 
 # === Request Schemas ===
 
@@ -17,14 +22,14 @@ from app.auth.models.membership import OrgRole
 class InviteRequest(BaseModel):
     """Schema for inviting a user."""
 
-    email: EmailStr
+    email: NormalizedEmail
     role: OrgRole = OrgRole.MEMBER
 
 
 class UserCreate(BaseModel):
     """Schema for org owner registration (creates user + organization)."""
 
-    email: EmailStr
+    email: NormalizedEmail
     password: str = Field(min_length=8, max_length=100)
     first_name: str = Field(min_length=1, max_length=100)
     last_name: str | None = Field(default=None, max_length=100)
@@ -35,7 +40,7 @@ class UserCreate(BaseModel):
 class UserCreateInvite(BaseModel):
     """Schema for invited user registration (joins existing org)."""
 
-    email: EmailStr
+    email: NormalizedEmail
     password: str = Field(min_length=8, max_length=100)
     first_name: str = Field(min_length=1, max_length=100)
     last_name: str | None = Field(default=None, max_length=100)
@@ -44,7 +49,7 @@ class UserCreateInvite(BaseModel):
 class UserLogin(BaseModel):
     """Schema for user login."""
 
-    email: EmailStr
+    email: NormalizedEmail
     password: str
 
 
@@ -161,7 +166,7 @@ class MessageResponse(BaseModel):
 
 
 class MagicLinkRequest(BaseModel):
-    email: EmailStr
+    email: NormalizedEmail
     flow: str | None = None  # "login", "signup", "reset"
 
 
@@ -173,7 +178,7 @@ class VerifyRequest(BaseModel):
 
 
 class VerifyOtpRequest(BaseModel):
-    email: EmailStr
+    email: NormalizedEmail
     otp: str = Field(min_length=6, max_length=6)
     flow: str | None = None
     device_info: str | None = ""
@@ -181,7 +186,7 @@ class VerifyOtpRequest(BaseModel):
 
 
 class PasswordLoginRequest(BaseModel):
-    email: EmailStr
+    email: NormalizedEmail
     password: str
     remember_me: bool = True
 
@@ -5,18 +5,33 @@ Includes rate limiting, reuse detection, session management.
 """
 
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
+from limits import RateLimitItemPerMinute
+
 from app.auth.models.user import User
 from app.auth.repositories.token import TokenRepository, MAGIC_LINK_RATE_LIMIT
 from app.auth.repositories.user import UserRepository
-from app.core.exceptions import AuthenticationError, RateLimitError
-from app.core.security import create_access_token, verify_password, hash_password
+from app.core.exceptions import (
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
+    ValidationError,
+)
+from app.core.rate_limit import hit_limit
+from app.core.security import (
+    DUMMY_PASSWORD_HASH,
+    create_access_token,
+    hash_password_async,
+    verify_password_async,
+)
 
 logger = logging.getLogger(__name__)
 
+_MAGIC_LINK_LIMIT = RateLimitItemPerMinute(MAGIC_LINK_RATE_LIMIT)
+
 
 # Placeholder for email service (prints to console in dev)
 def _send_magic_link_email(email: str, token: str, otp: Optional[str] = None) -> None:
@@ -39,12 +54,13 @@ class AuthService:
         self, email: str, ip_address: Optional[str] = None
     ) -> None:
         """Request a magic link. Rate limited to 3/min/email."""
-        email = email.lower().strip()
-
-        # Rate limit check (same as APILens)
-        one_minute_ago = datetime.now(timezone.utc) - timedelta(minutes=1)
-        recent = await self.token_repo.count_recent_magic_links(email, one_minute_ago)
-        if recent >= MAGIC_LINK_RATE_LIMIT:
+        # Shared limiter storage when available; otherwise count in the DB,
+        # which every worker sees
+        allowed = await hit_limit(_MAGIC_LINK_LIMIT, "magic-link", email)
+        if allowed is None:
+            recent = await self.token_repo.count_recent_magic_links(email)
+            allowed = recent < MAGIC_LINK_RATE_LIMIT
+        if not allowed:
             raise RateLimitError(
                 "Too many magic link requests. Please wait a moment."
             )
@@ -66,25 +82,7 @@ class AuthService:
 
         await self.token_repo.mark_magic_link_used(magic_token)
 
-        # Get or create user (same pattern as APILens)
-        user = await self.user_repo.get_by_email(magic_token.email)
-        if not user:
-            new_user = User(
-                email=magic_token.email,
-                first_name="User",
-                hashed_password="!",  # unusable password
-                email_verified=True,
-                auth_provider="magic_link",
-            )
-            user = await self.user_repo.create(new_user)
-            logger.info(f"New user created via magic link: {magic_token.email}")
-        elif not user.email_verified:
-            user.email_verified = True
-            await self.user_repo.update(user)
-
-        # Update last login
-        user.last_login_at = datetime.now(timezone.utc)
-        await self.user_repo.update(user)
+        user = await self._login_passwordless(magic_token.email, "magic_link")
 
         # Create tokens (pass remember_me)
         raw_refresh, _ = await self.token_repo.create_refresh_token(
@@ -103,7 +101,6 @@ class AuthService:
         remember_me: bool = True,
     ) -> tuple[str, str, User]:
         """Verify an OTP and return (access_token, refresh_token, user)."""
-        email = email.lower().strip()
         magic_token = await self.token_repo.get_magic_link_token_by_email(email)
         
         if not magic_token:
@@ -120,25 +117,7 @@ class AuthService:
 
         await self.token_repo.mark_magic_link_used(magic_token)
 
-        # Get or create user (same logic as magic link)
-        user = await self.user_repo.get_by_email(magic_token.email)
-        if not user:
-            new_user = User(
-                email=magic_token.email,
-                first_name="User",
-                hashed_password="!",  # unusable password
-                email_verified=True,
-                auth_provider="otp",
-            )
-            user = await self.user_repo.create(new_user)
-            logger.info(f"New user created via OTP: {magic_token.email}")
-        elif not user.email_verified:
-            user.email_verified = True
-            await self.user_repo.update(user)
-
-        # Update last login
-        user.last_login_at = datetime.now(timezone.utc)
-        await self.user_repo.update(user)
+        user = await self._login_passwordless(magic_token.email, "otp")
 
         # Create tokens (pass remember_me)
         raw_refresh, _ = await self.token_repo.create_refresh_token(
@@ -148,6 +127,30 @@ class AuthService:
 
         return access_token, raw_refresh, user
 
+    async def _login_passwordless(self, email: str, auth_provider: str) -> User:
+        """
+        Get or create the user behind a verified magic link / OTP and record
+        the login. Existing users cost a single UPDATE (verify + last login).
+        """
+        now = datetime.now(timezone.utc)
+        user = await self.user_repo.get_by_email(email)
+        if not user:
+            new_user = User(
+                email=email,
+                first_name="User",
+                hashed_password="!",  # unusable password
+                email_verified=True,
+                auth_provider=auth_provider,
+                last_login_at=now,
+            )
+            user = await self.user_repo.create(new_user)
+            logger.info(f"New user created via {auth_provider}: {email}")
+        else:
+            await self.user_repo.touch_login(
+                user.id, now, verify_email=not user.email_verified
+            )
+        return user
+
     # ── Password Login ────────────────────────────────────────────
 
     async def login_with_password(
@@ -159,15 +162,17 @@ class AuthService:
         remember_me: bool = True,
     ) -> tuple[str, str, User]:
         """Authenticate with email+password. Returns (access_token, refresh_token, user)."""
-        email = email.lower().strip()
-
         # Filter by is_active (gap #9 fix)
         user = await self.user_repo.get_active_by_email(email)
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not user.has_usable_password:
+            # Unknown account or no usable password: burn one bcrypt check
+            # against a dummy hash so timing matches a wrong password
+            await verify_password_async(password, DUMMY_PASSWORD_HASH)
+            raise AuthenticationError("Invalid email or password")
+        if not await verify_password_async(password, user.hashed_password):
             raise AuthenticationError("Invalid email or password")
 
-        user.last_login_at = datetime.now(timezone.utc)
-        await self.user_repo.update(user)
+        await self.user_repo.touch_login(user.id, datetime.now(timezone.utc))
 
         raw_refresh, _ = await self.token_repo.create_refresh_token(
             user, device_info, ip_address, remember_me=remember_me
@@ -213,18 +218,38 @@ class AuthService:
 
     async def get_profile(self, user_id: UUID) -> dict:
         """Get full profile for account settings page."""
-        from app.core.exceptions import NotFoundError
+        profile = await self.user_repo.get_profile(user_id)
+        if not profile:
+            raise NotFoundError("User")
 
+        return self._build_profile(profile)
+
+    async def update_profile(self, user_id: UUID, name: str) -> dict:
+        """Update user's display name (split into first_name/last_name)."""
         user = await self.user_repo.get_by_id(user_id)
         if not user:
             raise NotFoundError("User")
 
-        # Build display name from first/last name
-        display_name = user.first_name or ""
-        if user.last_name:
-            display_name = f"{display_name} {user.last_name}".strip()
-        if not display_name:
-            display_name = user.email.split("@")[0]
+        # Parse display name into first/last name
+        first_name, _, last_name = name.strip().partition(" ")
+        user.first_name = first_name
+        user.last_name = last_name.lstrip() or None
+
+        await self.user_repo.update(user)
+        logger.info(f"Profile updated for user {user_id}")
+
+        # Build from the in-memory user instead of re-reading it
+        return self._build_profile(user)
+
+    @staticmethod
+    def _build_profile(user) -> dict:
+        """Shape a User (or profile row) into the ProfileResponse payload."""
+        # Build display name from first/last name, else the email local part
+        first_name, last_name = user.first_name, user.last_name
+        if first_name and last_name:
+            display_name = f"{first_name} {last_name}".strip()
+        else:
+            display_name = first_name or last_name or user.email.partition("@")[0]
 
         return {
             "id": user.id,
@@ -234,29 +259,11 @@ class AuthService:
             "display_name": display_name,
             "picture": user.avatar_url,
             "email_verified": user.email_verified,
-            "has_password": bool(user.hashed_password and user.hashed_password != "!"),
+            "has_password": user.has_usable_password,
             "created_at": user.created_at,
             "last_login_at": user.last_login_at,
         }
 
-    async def update_profile(self, user_id: UUID, name: str) -> dict:
-        """Update user's display name (split into first_name/last_name)."""
-        from app.core.exceptions import NotFoundError
-
-        user = await self.user_repo.get_by_id(user_id)
-        if not user:
-            raise NotFoundError("User")
-
-        # Parse display name into first/last name
-        parts = name.strip().split(maxsplit=1)
-        user.first_name = parts[0]
-        user.last_name = parts[1] if len(parts) > 1 else None
-
-        await self.user_repo.update(user)
-        logger.info(f"Profile updated for user {user_id}")
-
-        return await self.get_profile(user_id)
-
     async def set_password(
         self,
         user_id: UUID,
@@ -265,8 +272,6 @@ class AuthService:
         current_password: str | None = None,
     ) -> None:
         """Set or change password with validation."""
-        from app.core.exceptions import NotFoundError, ValidationError
-
         if new_password != confirm_password:
             raise ValidationError("Passwords do not match")
 
@@ -274,34 +279,28 @@ class AuthService:
         if not user:
             raise NotFoundError("User")
 
-        has_password = bool(user.hashed_password and user.hashed_password != "!")
+        has_password = user.has_usable_password
 
         # If user already has a password, require current password
         if has_password:
             if not current_password:
                 raise AuthenticationError("Current password is required")
-            if not verify_password(current_password, user.hashed_password):
+            if not await verify_password_async(current_password, user.hashed_password):
                 raise AuthenticationError("Current password is incorrect")
 
-        user.hashed_password = hash_password(new_password)
+        user.hashed_password = await hash_password_async(new_password)
         await self.user_repo.update(user)
         logger.info(f"Password {'changed' if has_password else 'set'} for user {user_id}")
 
     async def delete_account(self, user_id: UUID) -> None:
         """Soft-delete account: deactivate and revoke all sessions."""
-        from app.core.exceptions import NotFoundError
-
-        user = await self.user_repo.get_by_id(user_id)
-        if not user:
+        # Soft-delete: deactivate instead of hard delete, atomically with the revoke
+        revoked = await self.user_repo.deactivate_and_revoke(
+            user_id, datetime.now(timezone.utc)
+        )
+        if revoked is None:
             raise NotFoundError("User")
 
-        # Soft-delete: deactivate instead of hard delete
-        user.is_active = False
-        user.deactivated_at = datetime.now(timezone.utc)
-        await self.user_repo.update(user)
-
-        # Revoke all sessions
-        revoked = await self.token_repo.revoke_all_user_sessions(user_id)
         logger.info(
             f"Account deactivated for user {user_id}, "
             f"{revoked} sessions revoked"
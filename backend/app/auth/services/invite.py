@@ -3,10 +3,17 @@ Invite service for managing organization invitations.
 Handles all invitation lifecycle: create, validate, accept, list, revoke.
 """
 
+import hashlib
+import math
+import time
 import uuid
 
+from cachetools import TTLCache
+from sqlalchemy import Row
+
+from app.core.database import after_commit
 from app.core.exceptions import AuthenticationError, ConflictError, NotFoundError
-from app.core.security import hash_password
+from app.core.security import hash_password_async
 from app.auth.models.invitation import Invitation
 from app.auth.models.membership import OrgRole, UserOrganization
 from app.auth.models.organization import Organization
@@ -25,7 +32,24 @@ from app.auth.schemas import (
     UserCreate,
     UserCreateInvite,
 )
-from app.core.security import create_access_token, create_refresh_token
+from app.core.security import create_token_pair
+
+
+# Short-lived validation results keyed by hashed token → (result, valid_until);
+# the public validate endpoint is polled. Per-worker: accept/revoke drop the
+# entry after commit on this worker only, and a positive result is never
+# served past the invitation's expires_at.
+_validation_cache: TTLCache[str, tuple[InviteValidation, float]] = TTLCache(
+    maxsize=10_000, ttl=60
+)
+
+
+def _validation_cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _forget_validation(token: str) -> None:
+    _validation_cache.pop(_validation_cache_key(token), None)
 
 
 class InviteService:
@@ -58,20 +82,11 @@ class InviteService:
         Authorization is handled by the route layer via Depends().
         This method only handles business logic.
         """
-        # Check if user is already a member
-        existing_user = await self.user_repo.get_by_email(invite_data.email)
-        if existing_user:
-            existing_membership = await self.membership_repo.get_membership(
-                existing_user.id, org_id
-            )
-            if existing_membership:
-                raise ConflictError("User is already a member")
-
-        # Check for existing pending invite
-        existing_invite = await self.invite_repo.get_by_email_and_org(
-            invite_data.email, org_id
-        )
-        if existing_invite:
+        # Membership + pending-invite checks in a single query
+        checks = await self.invite_repo.preflight_checks(invite_data.email, org_id)
+        if checks.is_member:
+            raise ConflictError("User is already a member")
+        if checks.has_pending_invite:
             raise ConflictError("Invitation already sent to this email")
 
         # Create invitation
@@ -89,14 +104,9 @@ class InviteService:
         self, org_id: uuid.UUID, invites: list[InviteRequest], inviter_id: uuid.UUID
     ) -> None:
         """Create invitations during organization registration."""
-        for invite_data in invites:
-            invitation = Invitation(
-                organization_id=org_id,
-                email=invite_data.email,
-                role=invite_data.role,
-                invited_by=inviter_id,
-            )
-            await self.invite_repo.create(invitation)
+        await self.invite_repo.create_many(
+            self._build_invitations(org_id, invites, inviter_id)
+        )
 
     async def register_owner(self, data: UserCreate) -> RegisterResult:
         """
@@ -105,20 +115,18 @@ class InviteService:
         """
         from app.core.utils import slugify
 
-        # 1. Check email uniqueness
-        if await self.user_repo.exists_by_email(data.email):
-            raise ConflictError("Email already registered")
-
-        # 2. Create User
+        # 1-2. Create User (fails on duplicate email)
         user = User(
-            email=data.email.lower().strip(),
-            hashed_password=hash_password(data.password),
+            email=data.email,
+            hashed_password=await hash_password_async(data.password),
             first_name=data.first_name,
             last_name=data.last_name,
         )
-        user = await self.user_repo.create(user)
+        user = await self.user_repo.create_if_absent(user)
+        if user is None:
+            raise ConflictError("Email already registered")
 
-        # 3. Create Organization with unique slug
+        # 3. Build Organization with unique slug
         base_slug = slugify(data.organization_name)
         slug = await self.org_repo.generate_unique_slug(base_slug)
 
@@ -126,29 +134,25 @@ class InviteService:
             name=data.organization_name,
             slug=slug,
         )
-        organization = await self.org_repo.create(organization)
 
-        # 4. Create Membership (OWNER)
+        # 4. Build Membership (OWNER)
         membership = UserOrganization(
             user_id=user.id,
             organization_id=organization.id,
             role=OrgRole.OWNER,
         )
-        await self.membership_repo.create(membership)
-
-        # 5. Create optional invites
-        if data.invites:
-            await self.create_invites_for_registration(
-                org_id=organization.id,
-                invites=data.invites,
-                inviter_id=user.id,
-            )
+
+        # 5. Persist org + membership + optional invites in one flush
+        await self.org_repo.create_with_owner(
+            organization,
+            membership,
+            self._build_invitations(organization.id, data.invites, user.id),
+        )
 
         # 6. Generate tokens
-        access_token = create_access_token(str(user.id))
-        refresh_token = create_refresh_token(str(user.id))
+        access_token, refresh_token = create_token_pair(str(user.id))
 
-        return RegisterResult(
+        return RegisterResult.model_construct(
             access_token=access_token,
             refresh_token=refresh_token,
             user_id=user.id,
@@ -156,69 +160,74 @@ class InviteService:
         )
 
     async def validate_invite(self, token: str) -> InviteValidation:
-        """Validate an invitation token and return typed details."""
-        invitation = await self.invite_repo.get_by_token(token)
+        """Validate an invitation token and return typed details (cached briefly)."""
+        cache_key = _validation_cache_key(token)
+        cached = _validation_cache.get(cache_key)
+        if cached is not None and cached[1] > time.time():
+            return cached[0]
+
+        validation, valid_until = await self._validate_invite_uncached(token)
+        _validation_cache[cache_key] = (validation, valid_until)
+        return validation
+
+    async def _validate_invite_uncached(
+        self, token: str
+    ) -> tuple[InviteValidation, float]:
+        """
+        Look up an invitation token and evaluate its validity.
+        Also returns when the result stops holding: the invitation's expiry
+        for a valid token, never for an unusable one.
+        """
+        invitation, organization = await self.invite_repo.get_by_token_with_org(
+            token, require_valid=True
+        )
 
         if invitation is None:
-            return InviteValidation(
-                is_valid=False, email="", organization_name="", role=""
-            )
-
-        if invitation.is_expired:
-            return InviteValidation(
-                is_valid=False, email=invitation.email, organization_name="", role=""
-            )
-
-        if invitation.is_accepted:
-            return InviteValidation(
-                is_valid=False, email=invitation.email, organization_name="", role=""
+            # Cold path: unknown, expired or accepted — report the email if known
+            invitation = await self.invite_repo.get_by_token(token)
+            validation = InviteValidation.model_construct(
+                is_valid=False,
+                email=invitation.email if invitation else "",
+                organization_name="",
+                role="",
             )
+            return validation, math.inf
 
-        organization = await self.org_repo.get_by_id(invitation.organization_id)
-
-        return InviteValidation(
+        validation = InviteValidation.model_construct(
             is_valid=True,
             email=invitation.email,
             organization_name=organization.name if organization else "",
             role=invitation.role.value,
         )
+        return validation, invitation.expires_at.timestamp()
 
     async def register_with_invite(
         self, user_data: UserCreateInvite, invite_token: str
     ) -> LoginResponse:
         """Register a new user using an invitation token."""
-        # Validate invitation
-        invitation = await self.invite_repo.get_by_token(invite_token)
-
+        # Validate invitation (organization comes back in the same query)
+        invitation, organization = await self.invite_repo.get_by_token_with_org(
+            invite_token, require_valid=True
+        )
         if invitation is None:
-            raise NotFoundError("Invitation")
+            raise await self._unusable_invite_error(invite_token)
 
-        if invitation.is_expired:
-            raise AuthenticationError("Invitation has expired")
-
-        if invitation.is_accepted:
-            raise ConflictError("Invitation already used")
-
-        if invitation.email.lower() != user_data.email.lower():
+        if invitation.email != user_data.email:
             raise AuthenticationError("Email does not match invitation")
 
-        # Check if email already exists
-        if await self.user_repo.exists_by_email(user_data.email):
-            raise ConflictError("Email already registered")
-
-        # Get organization
-        organization = await self.org_repo.get_by_id(invitation.organization_id)
         if organization is None:
             raise NotFoundError("Organization")
 
-        # Create user
+        # Create user (fails on duplicate email)
         user = User(
             email=user_data.email,
-            hashed_password=hash_password(user_data.password),
+            hashed_password=await hash_password_async(user_data.password),
             first_name=user_data.first_name,
             last_name=user_data.last_name,
         )
-        user = await self.user_repo.create(user)
+        user = await self.user_repo.create_if_absent(user)
+        if user is None:
+            raise ConflictError("Email already registered")
 
         # Create membership with invited role
         membership = UserOrganization(
@@ -226,18 +235,20 @@ class InviteService:
             organization_id=organization.id,
             role=invitation.role,
         )
-        await self.membership_repo.create(membership)
-
-        # Mark invitation as accepted
-        await self.invite_repo.mark_accepted(invitation)
+        # Insert membership + mark invitation accepted in one round trip
+        await self.invite_repo.accept_with_membership(invitation, membership)
+        after_commit(
+            self.invite_repo.session, lambda: _forget_validation(invitation.token)
+        )
 
         # Generate tokens and return with org info
+        # Response DTOs are built from trusted server data; skip validation
         tokens = self._create_tokens(str(user.id))
-        return LoginResponse(
+        return LoginResponse.model_construct(
             access_token=tokens.access_token,
             refresh_token=tokens.refresh_token,
             organizations=[
-                OrganizationBrief(
+                OrganizationBrief.model_construct(
                     id=organization.id,
                     name=organization.name,
                     slug=organization.slug,
@@ -246,61 +257,56 @@ class InviteService:
             ],
         )
 
-    async def accept_invite(self, user_id: str, invite_token: str) -> OrganizationBrief:
+    async def accept_invite(self, user_id: uuid.UUID, invite_token: str) -> OrganizationBrief:
         """
         Accept an invitation for an existing authenticated user.
         Adds user to the organization without re-registering.
         """
-        # Validate invitation
-        invitation = await self.invite_repo.get_by_token(invite_token)
-
+        # Validate invitation (organization comes back in the same query)
+        invitation, organization = await self.invite_repo.get_by_token_with_org(
+            invite_token, require_valid=True
+        )
         if invitation is None:
-            raise NotFoundError("Invitation")
-
-        if invitation.is_expired:
-            raise AuthenticationError("Invitation has expired")
+            raise await self._unusable_invite_error(invite_token)
 
-        if invitation.is_accepted:
-            raise ConflictError("Invitation already used")
-
-        # Get user
-        user = await self.user_repo.get_by_id(uuid.UUID(user_id))
+        # Get user's email and existing membership in one query
+        user = await self.user_repo.get_email_with_membership(
+            user_id, invitation.organization_id
+        )
         if user is None:
             raise NotFoundError("User")
 
         # Verify email matches
-        if invitation.email.lower() != user.email.lower():
+        if invitation.email != user.email:
             raise AuthenticationError("Invitation was sent to a different email")
 
-        # Get organization
-        organization = await self.org_repo.get_by_id(invitation.organization_id)
         if organization is None:
             raise NotFoundError("Organization")
 
         # Check if already a member
-        existing = await self.membership_repo.get_membership(user.id, organization.id)
-        if existing:
+        if user.is_member:
             raise ConflictError("Already a member of this organization")
 
         # Create membership
         membership = UserOrganization(
-            user_id=user.id,
+            user_id=user_id,
             organization_id=organization.id,
             role=invitation.role,
         )
-        await self.membership_repo.create(membership)
-
-        # Mark invitation as accepted
-        await self.invite_repo.mark_accepted(invitation)
+        # Insert membership + mark invitation accepted in one round trip
+        await self.invite_repo.accept_with_membership(invitation, membership)
+        after_commit(
+            self.invite_repo.session, lambda: _forget_validation(invitation.token)
+        )
 
-        return OrganizationBrief(
+        return OrganizationBrief.model_construct(
             id=organization.id,
             name=organization.name,
             slug=organization.slug,
             role=invitation.role.value,
         )
 
-    async def list_pending_invites(self, org_id: uuid.UUID) -> list[Invitation]:
+    async def list_pending_invites(self, org_id: uuid.UUID) -> list[Row]:
         """List all pending invitations for an organization."""
         return await self.invite_repo.get_pending_by_org(org_id)
 
@@ -313,10 +319,38 @@ class InviteService:
             raise NotFoundError("Invitation")
 
         await self.invite_repo.delete(invitation)
+        after_commit(
+            self.invite_repo.session, lambda: _forget_validation(invitation.token)
+        )
+
+    async def _unusable_invite_error(self, token: str) -> Exception:
+        """Work out why a token failed the validity filter (cold path)."""
+        invitation = await self.invite_repo.get_by_token(token)
+        if invitation is None:
+            return NotFoundError("Invitation")
+        if invitation.is_accepted and not invitation.is_expired:
+            return ConflictError("Invitation already used")
+        return AuthenticationError("Invitation has expired")
+
+    @staticmethod
+    def _build_invitations(
+        org_id: uuid.UUID, invites: list[InviteRequest], inviter_id: uuid.UUID
+    ) -> list[Invitation]:
+        """Build (unsaved) invitation rows from invite requests."""
+        return [
+            Invitation(
+                organization_id=org_id,
+                email=invite_data.email,
+                role=invite_data.role,
+                invited_by=inviter_id,
+            )
+            for invite_data in invites
+        ]
 
     def _create_tokens(self, user_id: str) -> TokenResponse:
         """Generate access and refresh tokens for a user."""
-        return TokenResponse(
-            access_token=create_access_token(user_id),
-            refresh_token=create_refresh_token(user_id),
+        access_token, refresh_token = create_token_pair(user_id)
+        return TokenResponse.model_construct(
+            access_token=access_token,
+            refresh_token=refresh_token,
         )
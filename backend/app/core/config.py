@@ -22,12 +22,20 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    db_pool_size: int = 20
+    db_max_overflow: int = 20
+    db_pool_recycle_seconds: int = 1800
+    db_statement_cache_size: int = 1024
 
     # Security
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
+    password_hash_workers: int | None = None  # Defaults to CPU count
+
+    # Rate limiting (shared across workers when set)
+    redis_url: str | None = None
 
     # Application
     app_name: str = "Sentinel Core"
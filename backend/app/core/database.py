@@ -3,10 +3,10 @@ Async database connection using SQLModel + asyncpg.
 Provides session factory and table initialization.
 """
 
-from collections.abc import AsyncGenerator
+from collections.abc import Callable
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
 from app.core.config import get_settings
@@ -18,25 +18,47 @@ engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,  # Log SQL queries in debug mode
     future=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle_seconds,  # Drop connections before server-side timeouts
     pool_pre_ping=True,  # Verify connections before use
+    pool_use_lifo=True,  # Reuse the most recent (warm statement cache) connection
+    connect_args={
+        # asyncpg server-side prepared statements + SQLAlchemy's per-connection cache
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+        # Short OLTP lookups never amortize JIT compilation
+        "server_settings": {"jit": "off"},
+    },
 )
 
 # Async session factory
-async_session_factory = sessionmaker(
+async_session_factory = async_sessionmaker(
     bind=engine,
-    class_=AsyncSession,
     expire_on_commit=False,
-    autocommit=False,
     autoflush=False,
 )
 
 
+def after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Run `callback` once the session's current transaction commits.
+    For invalidating in-process caches: dropping an entry before the commit
+    lets a concurrent reader re-cache the old row.
+    """
+    event.listen(
+        session.sync_session, "after_commit", lambda _session: callback(), once=True
+    )
+
+
+# Arbitrary app-wide key for the startup schema lock
+_INIT_DB_LOCK_KEY = 71717
+
+
 async def init_db() -> None:
     """
     Initialize database tables.
-    Called on application startup.
+    Called on application startup; creates any mapped tables still missing.
     """
     # Import models to register them with SQLModel.metadata
     from app.auth.models.invitation import Invitation  # noqa: F401
@@ -45,23 +67,18 @@ async def init_db() -> None:
     from app.auth.models.user import User  # noqa: F401
     from app.auth.models.token import RefreshToken, MagicLinkToken  # noqa: F401
     from app.services.models import Service  # noqa: F401
-    from app.incidents.models import Incident, IncidentAttachment  # noqa: F401
+    from app.incidents.models import (  # noqa: F401
+        Incident,
+        IncidentAttachment,
+        IncidentCounter,
+        IncidentStatCount,
+    )
 
     async with engine.begin() as conn:
+        # Serialize concurrent workers; the lock is released at commit
+        await conn.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"), {"key": _INIT_DB_LOCK_KEY}
+        )
+        # create_all checks each table first, so existing ones are left alone
+        # and tables added since the last boot are created
         await conn.run_sync(SQLModel.metadata.create_all)
-
-
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    """
-    Dependency that provides an async database session.
-    Automatically handles commit/rollback and cleanup.
-    """
-    async with async_session_factory() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
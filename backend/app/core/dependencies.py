@@ -4,42 +4,102 @@ Provides reusable dependencies for routes.
 Wires up the Repository → Service → Route chain.
 """
 
-from fastapi import Depends
+import hashlib
+import time
+import uuid
+from collections.abc import AsyncGenerator
+
+from cachetools import TTLCache
+from fastapi import Depends, Request
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_session
+from app.auth.repositories.invitation import InvitationRepository
+from app.auth.repositories.membership import MembershipRepository
+from app.auth.repositories.organization import OrganizationRepository
+from app.auth.repositories.token import TokenRepository
+from app.auth.repositories.user import UserRepository
+from app.auth.services.auth import AuthService
+from app.auth.services.invite import InviteService
+from app.core.database import async_session_factory
 from app.core.exceptions import AuthenticationError
 from app.core.security import decode_token
+from app.incidents.repository import IncidentRepository
+from app.incidents.service import IncidentService
+from app.services.repository import ServiceRepository
+from app.services.service import ServiceService
+
+
+class _BearerTokenScheme(OAuth2PasswordBearer):
+    """
+    OAuth2PasswordBearer with a direct header slice instead of the generic
+    scheme/param split. Still a SecurityBase, so OpenAPI docs are unchanged.
+    """
+
+    async def __call__(self, request: Request) -> str:
+        authorization = request.headers.get("authorization")
+        if authorization is not None and authorization[:7].lower() == "bearer ":
+            return authorization[7:]
+        raise self.make_not_authenticated_error()
+
 
 # OAuth2 scheme for Bearer token extraction
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+oauth2_scheme = _BearerTokenScheme(
+    tokenUrl="/api/auth/login", scheme_name="OAuth2PasswordBearer"
+)
+
+# Recently verified access tokens → (user_id, exp). Clients send bursts of
+# requests with the same token, so this skips repeat signature checks.
+# Per-worker; entries never outlive the token's own expiry.
+_access_token_cache: TTLCache[bytes, tuple[uuid.UUID, float]] = TTLCache(
+    maxsize=10_000, ttl=30
+)
 
 
-async def get_db() -> AsyncSession:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Database session dependency.
+    Commits on success, rolls back on error, closes on exit.
     Usage: db: AsyncSession = Depends(get_db)
     """
-    async for session in get_session():
-        yield session
+    async with async_session_factory() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
 
 
-async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> str:
+async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> uuid.UUID:
     """
     Extract and validate user ID from JWT token.
-    Usage: user_id: str = Depends(get_current_user_id)
+    Parsed to a UUID once here so routes and services never re-parse it.
+    Usage: user_id: uuid.UUID = Depends(get_current_user_id)
     """
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _access_token_cache.get(cache_key)
+    if cached is not None and cached[1] > time.time():
+        return cached[0]
+
     payload = decode_token(token)
     if payload is None:
         raise AuthenticationError("Could not validate credentials")
 
-    user_id: str | None = payload.get("sub")
+    subject: str | None = payload.get("sub")
     token_type: str | None = payload.get("type")
 
-    if user_id is None or token_type != "access":
+    if subject is None or token_type != "access":
+        raise AuthenticationError("Could not validate credentials")
+
+    try:
+        user_id = uuid.UUID(subject)
+    except ValueError:
         raise AuthenticationError("Could not validate credentials")
 
+    expires_at = payload.get("exp")
+    if expires_at is not None:
+        _access_token_cache[cache_key] = (user_id, float(expires_at))
     return user_id
 
 
@@ -47,31 +107,26 @@ async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> str:
 
 def get_user_repo(db: AsyncSession = Depends(get_db)):
     """Provide UserRepository instance."""
-    from app.auth.repositories.user import UserRepository
     return UserRepository(db)
 
 
 def get_token_repo(db: AsyncSession = Depends(get_db)):
     """Provide TokenRepository instance."""
-    from app.auth.repositories.token import TokenRepository
     return TokenRepository(db)
 
 
 def get_org_repo(db: AsyncSession = Depends(get_db)):
     """Provide OrganizationRepository instance."""
-    from app.auth.repositories.organization import OrganizationRepository
     return OrganizationRepository(db)
 
 
 def get_membership_repo(db: AsyncSession = Depends(get_db)):
     """Provide MembershipRepository instance."""
-    from app.auth.repositories.membership import MembershipRepository
     return MembershipRepository(db)
 
 
 def get_invite_repo(db: AsyncSession = Depends(get_db)):
     """Provide InvitationRepository instance."""
-    from app.auth.repositories.invitation import InvitationRepository
     return InvitationRepository(db)
 
 
@@ -82,7 +137,6 @@ def get_auth_service(
     token_repo=Depends(get_token_repo),
 ):
     """Provide AuthService with injected repositories."""
-    from app.auth.services.auth import AuthService
     return AuthService(user_repo, token_repo)
 
 
@@ -93,7 +147,6 @@ def get_invite_service(
     user_repo=Depends(get_user_repo),
 ):
     """Provide InviteService with injected repositories."""
-    from app.auth.services.invite import InviteService
     return InviteService(invite_repo, org_repo, membership_repo, user_repo)
 
 
@@ -101,13 +154,11 @@ def get_invite_service(
 
 def get_service_repo(db: AsyncSession = Depends(get_db)):
     """Provide ServiceRepository instance."""
-    from app.services.repository import ServiceRepository
     return ServiceRepository(db)
 
 
 def get_incident_repo(db: AsyncSession = Depends(get_db)):
     """Provide IncidentRepository instance."""
-    from app.incidents.repository import IncidentRepository
     return IncidentRepository(db)
 
 
@@ -117,7 +168,6 @@ def get_service_service(
     repo=Depends(get_service_repo),
 ):
     """Provide ServiceService with injected repository."""
-    from app.services.service import ServiceService
     return ServiceService(repo)
 
 
@@ -125,5 +175,4 @@ def get_incident_service(
     repo=Depends(get_incident_repo),
 ):
     """Provide IncidentService with injected repository."""
-    from app.incidents.service import IncidentService
     return IncidentService(repo)
@@ -3,8 +3,11 @@ Global exception handlers for mapping domain exceptions to HTTP responses.
 Eliminates try/except boilerplate from route handlers.
 """
 
+from typing import Any
+
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from pydantic_core import to_json
 
 from app.core.exceptions import (
     AuthenticationError,
@@ -17,96 +20,60 @@ from app.core.exceptions import (
     ValidationError,
 )
 
+# Shared, never mutated: Starlette copies headers into the raw header list
+_AUTH_HEADERS = {"WWW-Authenticate": "Bearer"}
+# The 500 body is constant, so serialize it once
+_INTERNAL_ERROR_BODY = b'{"detail":"An internal error occurred"}'
 
-async def authentication_error_handler(
-    request: Request, exc: AuthenticationError
-) -> JSONResponse:
-    """Handle authentication failures → 401."""
-    return JSONResponse(
-        status_code=401,
-        content={"detail": exc.message},
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+# Domain exception → (status code, extra headers); the message is the detail
+_ERROR_RESPONSES: dict[type[SentinelException], tuple[int, dict[str, str] | None]] = {
+    AuthenticationError: (401, _AUTH_HEADERS),
+    TokenExpiredError: (401, _AUTH_HEADERS),
+    AuthorizationError: (403, None),
+    NotFoundError: (404, None),
+    ConflictError: (409, None),
+    RateLimitError: (429, None),
+    ValidationError: (422, None),
+}
 
 
-async def token_expired_error_handler(
-    request: Request, exc: TokenExpiredError
-) -> JSONResponse:
-    """Handle expired tokens → 401."""
-    return JSONResponse(
-        status_code=401,
-        content={"detail": exc.message},
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+class ErrorResponse(JSONResponse):
+    """JSONResponse encoded by pydantic-core's Rust serializer instead of json.dumps."""
 
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
 
-async def authorization_error_handler(
-    request: Request, exc: AuthorizationError
-) -> JSONResponse:
-    """Handle authorization failures → 403."""
-    return JSONResponse(
-        status_code=403,
-        content={"detail": exc.message},
-    )
-
-
-async def not_found_error_handler(
-    request: Request, exc: NotFoundError
-) -> JSONResponse:
-    """Handle resource not found → 404."""
-    return JSONResponse(
-        status_code=404,
-        content={"detail": exc.message},
-    )
 
-
-async def conflict_error_handler(
-    request: Request, exc: ConflictError
-) -> JSONResponse:
-    """Handle resource conflicts → 409."""
-    return JSONResponse(
-        status_code=409,
-        content={"detail": exc.message},
-    )
-
-
-async def rate_limit_error_handler(
-    request: Request, exc: RateLimitError
-) -> JSONResponse:
-    """Handle rate limit exceeded → 429."""
-    return JSONResponse(
-        status_code=429,
-        content={"detail": exc.message},
-    )
-
-
-async def validation_error_handler(
-    request: Request, exc: ValidationError
-) -> JSONResponse:
-    """Handle validation failures → 422."""
-    return JSONResponse(
-        status_code=422,
+async def domain_error_handler(
+    request: Request, exc: SentinelException
+) -> ErrorResponse:
+    """Map a domain exception to its status code, using its message as the detail."""
+    # Starlette dispatches on the MRO, so subclasses land here too
+    for cls in type(exc).__mro__:
+        mapping = _ERROR_RESPONSES.get(cls)
+        if mapping is not None:
+            break
+    status_code, headers = mapping
+    return ErrorResponse(
+        status_code=status_code,
         content={"detail": exc.message},
+        headers=headers,
     )
 
 
 async def sentinel_error_handler(
     request: Request, exc: SentinelException
-) -> JSONResponse:
+) -> Response:
     """Catch-all for unhandled Sentinel exceptions → 500."""
-    return JSONResponse(
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
         status_code=500,
-        content={"detail": "An internal error occurred"},
+        media_type="application/json",
     )
 
 
 def register_exception_handlers(app) -> None:
     """Register all global exception handlers on the FastAPI app."""
-    app.add_exception_handler(AuthenticationError, authentication_error_handler)
-    app.add_exception_handler(TokenExpiredError, token_expired_error_handler)
-    app.add_exception_handler(AuthorizationError, authorization_error_handler)
-    app.add_exception_handler(NotFoundError, not_found_error_handler)
-    app.add_exception_handler(ConflictError, conflict_error_handler)
-    app.add_exception_handler(RateLimitError, rate_limit_error_handler)
-    app.add_exception_handler(ValidationError, validation_error_handler)
+    for exc_class in _ERROR_RESPONSES:
+        app.add_exception_handler(exc_class, domain_error_handler)
     app.add_exception_handler(SentinelException, sentinel_error_handler)
@@ -8,6 +8,9 @@ from fastapi import HTTPException, status
 class SentinelException(Exception):
     """Base exception for all Sentinel errors."""
 
+    # Slotted so raising doesn't allocate an instance __dict__
+    __slots__ = ("message",)
+
     def __init__(self, message: str = "An error occurred"):
         self.message = message
         super().__init__(self.message)
@@ -16,6 +19,8 @@ class SentinelException(Exception):
 class AuthenticationError(SentinelException):
     """Raised when authentication fails."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Could not validate credentials"):
         super().__init__(message)
 
@@ -23,6 +28,8 @@ class AuthenticationError(SentinelException):
 class TokenExpiredError(SentinelException):
     """Raised when a token (access, refresh, magic link) has expired."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Token has expired"):
         super().__init__(message)
 
@@ -30,6 +37,8 @@ class TokenExpiredError(SentinelException):
 class RateLimitError(SentinelException):
     """Raised when a rate limit is exceeded."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Too many requests. Please wait."):
         super().__init__(message)
 
@@ -37,6 +46,8 @@ class RateLimitError(SentinelException):
 class AuthorizationError(SentinelException):
     """Raised when user lacks permission."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Not enough permissions"):
         super().__init__(message)
 
@@ -44,6 +55,8 @@ class AuthorizationError(SentinelException):
 class NotFoundError(SentinelException):
     """Raised when a resource is not found."""
 
+    __slots__ = ()
+
     def __init__(self, resource: str = "Resource"):
         super().__init__(f"{resource} not found")
 
@@ -51,6 +64,8 @@ class NotFoundError(SentinelException):
 class ConflictError(SentinelException):
     """Raised when a resource already exists."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Resource already exists"):
         super().__init__(message)
 
@@ -58,6 +73,8 @@ class ConflictError(SentinelException):
 class ValidationError(SentinelException):
     """Raised when input validation fails."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Validation error"):
         super().__init__(message)
 
@@ -5,6 +5,12 @@ Security middleware for HTTP headers and request protection.
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Load balancer probes get the same body as the /health route
+_HEALTH_RESPONSE = Response(
+    content=b'{"status":"operational"}', media_type="application/json"
+)
 
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
@@ -33,3 +39,25 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         )
 
         return response
+
+
+class HealthCheckMiddleware:
+    """
+    Answers GET /health before any other middleware runs.
+    Pure ASGI (no BaseHTTPMiddleware task/stream wrapping); added last so it
+    sits outermost, ahead of CORS and security headers.
+    """
+
+    def __init__(self, app: ASGIApp, path: str = "/health") -> None:
+        self.app = app
+        self.path = path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["path"] == self.path
+            and scope["method"] == "GET"
+        ):
+            await _HEALTH_RESPONSE(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
@@ -5,29 +5,41 @@ Ensures users can only access their own organization data.
 
 import uuid
 
+from cachetools import TTLCache
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_current_user_id, get_db
+from app.core.dependencies import get_current_user_id, get_membership_repo
 from app.core.exceptions import AuthorizationError, NotFoundError
 from app.auth.models.membership import OrgRole, UserOrganization
 from app.auth.models.organization import Organization
 from app.auth.repositories.membership import MembershipRepository
-from app.auth.repositories.organization import OrganizationRepository
+
+# (user_id, org slug) → (Organization, UserOrganization) for members only.
+# Non-members and unknown slugs always hit the DB, so a just-accepted invite
+# takes effect immediately; there is no membership removal/role change path
+# yet — one would need to pop the affected entries here.
+_org_access_cache: TTLCache[
+    tuple[uuid.UUID, str], tuple[Organization, UserOrganization]
+] = TTLCache(maxsize=4096, ttl=30)
 
 
 async def verify_organization_access(
     organization_slug: str,
-    user_id: str = Depends(get_current_user_id),
-    db: AsyncSession = Depends(get_db),
+    user_id: uuid.UUID = Depends(get_current_user_id),
+    membership_repo: MembershipRepository = Depends(get_membership_repo),
 ) -> tuple[Organization, UserOrganization]:
     """
     Verify user has access to the specified organization.
 
+    Resolves the slug and the user's membership in a single query, cached
+    per worker for 30s; the repository comes from the shared provider, so
+    FastAPI's per-request dependency cache hands the same instance to
+    downstream services.
+
     Args:
         organization_slug: Organization slug from URL path
         user_id: Authenticated user ID from JWT
-        db: Database session
+        membership_repo: Membership repository
 
     Returns:
         Tuple of (Organization, UserOrganization) for further role checks
@@ -36,21 +48,21 @@ async def verify_organization_access(
         NotFoundError: Organization not found
         AuthorizationError: User not a member
     """
-    org_repo = OrganizationRepository(db)
-    membership_repo = MembershipRepository(db)
+    cache_key = (user_id, organization_slug)
+    cached = _org_access_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    # Get organization by slug
-    organization = await org_repo.get_by_slug(organization_slug)
+    organization, membership = await membership_repo.get_with_org_by_slug(
+        user_id, organization_slug
+    )
     if organization is None:
         raise NotFoundError("Organization")
 
-    # Verify user is a member
-    membership = await membership_repo.get_membership(
-        uuid.UUID(user_id), organization.id
-    )
     if membership is None:
         raise AuthorizationError("Access denied: not a member of this organization")
 
+    _org_access_cache[cache_key] = (organization, membership)
     return organization, membership
 
 
@@ -0,0 +1,69 @@
+"""
+Shared rate limiter for all routers.
+Uses a Redis-backed moving window when REDIS_URL is set, so limits hold
+across uvicorn/gunicorn workers; falls back to in-process memory in dev.
+"""
+
+import asyncio
+import logging
+
+from limits import RateLimitItem
+from slowapi import Limiter
+from starlette.requests import Request
+
+from app.core.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "rl"
+
+
+def client_ip(request: Request) -> str:
+    """
+    Rate limit key per client IP.
+    Reads the ASGI scope directly (same result as slowapi's
+    get_remote_address, without building a request.client Address).
+    """
+    client = request.scope.get("client")
+    return client[0] if client and client[0] else "127.0.0.1"
+
+
+def org_scoped_key(request: Request) -> str:
+    """Rate limit key per (organization, client IP)."""
+    org_slug = request.path_params.get("organization_slug", "")
+    return f"{org_slug}:{client_ip(request)}"
+
+
+limiter = Limiter(
+    key_func=client_ip,
+    storage_uri=settings.redis_url or "memory://",
+    strategy="moving-window",
+    key_prefix=_KEY_PREFIX,
+    in_memory_fallback_enabled=settings.redis_url is not None,
+)
+
+
+async def hit_limit(limit: RateLimitItem, *identifiers: str) -> bool | None:
+    """
+    Consume one unit of `limit` for `identifiers` on the shared (Redis) storage.
+    For limits keyed on request data (not route/IP); False once exhausted.
+    The Redis round trip runs on the default executor, off the event loop.
+
+    Returns None when there is no shared storage (in-process memory would
+    multiply the limit by the worker count) or it is unreachable, including
+    while slowapi has switched to its in-memory fallback; the caller must
+    then enforce the limit some other way.
+    """
+    if settings.redis_url is None or limiter._storage_dead:
+        return None
+    loop = asyncio.get_running_loop()
+    try:
+        # limiter._limiter, not limiter.limiter: the property hands back the
+        # per-process fallback once the storage has been marked dead.
+        return await loop.run_in_executor(
+            None, limiter._limiter.hit, limit, _KEY_PREFIX, *identifiers
+        )
+    except Exception:
+        logger.warning("Rate limit storage unavailable", exc_info=True)
+        return None
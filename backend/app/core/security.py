@@ -2,27 +2,72 @@
 Security utilities for password hashing and JWT token management.
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+from jose import JWTError, jwk, jwt
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
-# Password hashing context (bcrypt with cost factor 12)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# JWT signing key, constructed once instead of per encode/decode
+_signing_key = jwk.construct(settings.secret_key, settings.algorithm)
+
+# bcrypt cost factor; the C extension is called directly (no passlib dispatch)
+BCRYPT_ROUNDS = 12
+# bcrypt only uses the first 72 bytes; truncate explicitly (bcrypt>=5 raises)
+_BCRYPT_MAX_BYTES = 72
+
+# Cost-12 bcrypt hash of a random, discarded secret. Verifying against it
+# costs as much as a real check, so failed logins for unknown accounts
+# take the same time as wrong passwords (no user-enumeration oracle).
+DUMMY_PASSWORD_HASH = "$2b$12$xD1RqphYL2h1oMX6/8pWJeWU/6LT/78P32u6SICMkBV3lPdQXvvqy"
 
 
 def hash_password(password: str) -> str:
     """Hash a plain-text password using bcrypt."""
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode()[:_BCRYPT_MAX_BYTES], salt).decode()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain-text password against a hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode()[:_BCRYPT_MAX_BYTES], hashed_password.encode()
+        )
+    except ValueError:  # Not a bcrypt hash (e.g. the "!" passwordless marker)
+        return False
+
+
+# Bounded pool for CPU-bound bcrypt work (bcrypt releases the GIL)
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers or os.cpu_count() or 1,
+    thread_name_prefix="pwd-hash",
+)
+
+
+def shutdown_hash_executor() -> None:
+    """Release bcrypt worker threads (called on application shutdown)."""
+    _hash_executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the bcrypt pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the bcrypt pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _hash_executor, verify_password, plain_password, hashed_password
+    )
 
 
 def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
@@ -36,20 +81,16 @@ def create_access_token(subject: str, expires_delta: timedelta | None = None) ->
     Returns:
         Encoded JWT string
     """
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.access_token_expire_minutes
-        )
+    expire = datetime.now(timezone.utc) + (
+        expires_delta or timedelta(minutes=settings.access_token_expire_minutes)
+    )
 
     payload = {
         "sub": subject,
         "exp": expire,
         "type": "access",
-        "iat": datetime.now(timezone.utc),
     }
-    return jwt.encode(payload, settings.secret_key, algorithm=settings.algorithm)
+    return jwt.encode(payload, _signing_key, algorithm=settings.algorithm)
 
 
 def create_refresh_token(subject: str) -> str:
@@ -69,9 +110,32 @@ def create_refresh_token(subject: str) -> str:
         "sub": subject,
         "exp": expire,
         "type": "refresh",
-        "iat": datetime.now(timezone.utc),
     }
-    return jwt.encode(payload, settings.secret_key, algorithm=settings.algorithm)
+    return jwt.encode(payload, _signing_key, algorithm=settings.algorithm)
+
+
+def create_token_pair(subject: str) -> tuple[str, str]:
+    """
+    Create an (access, refresh) JWT pair for the same subject.
+
+    Both tokens share one clock read for their expirations.
+    """
+    now = datetime.now(timezone.utc)
+
+    access_payload = {
+        "sub": subject,
+        "exp": now + timedelta(minutes=settings.access_token_expire_minutes),
+        "type": "access",
+    }
+    refresh_payload = {
+        "sub": subject,
+        "exp": now + timedelta(days=settings.refresh_token_expire_days),
+        "type": "refresh",
+    }
+    return (
+        jwt.encode(access_payload, _signing_key, algorithm=settings.algorithm),
+        jwt.encode(refresh_payload, _signing_key, algorithm=settings.algorithm),
+    )
 
 
 def decode_token(token: str) -> dict | None:
@@ -86,7 +150,7 @@ def decode_token(token: str) -> dict | None:
     """
     try:
         payload = jwt.decode(
-            token, settings.secret_key, algorithms=[settings.algorithm]
+            token, _signing_key, algorithms=[settings.algorithm]
         )
         return payload
     except JWTError:
@@ -4,10 +4,21 @@ Shared utility functions.
 
 import re
 
+_NON_SLUG_CHARS = re.compile(r"[^\w\s-]")
+_SLUG_SEPARATORS = re.compile(r"[\s_-]+")
 
-def slugify(text: str) -> str:
-    """Convert text to a URL-safe slug."""
+# ASCII fast path: delete the same characters _NON_SLUG_CHARS would strip
+_ASCII_STRIP_TABLE = {
+    code: None for code in range(128) if _NON_SLUG_CHARS.match(chr(code))
+}
+
+
+def slugify(text: str, max_length: int | None = 100) -> str:
+    """Convert text to a URL-safe slug (truncated to max_length, if set)."""
     text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_-]+", "-", text)
-    return text[:100]
+    if text.isascii():
+        text = text.translate(_ASCII_STRIP_TABLE)
+    else:
+        text = _NON_SLUG_CHARS.sub("", text)
+    text = _SLUG_SEPARATORS.sub("-", text)
+    return text[:max_length]
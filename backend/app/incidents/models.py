@@ -7,7 +7,7 @@ import uuid
 from datetime import datetime, timezone
 from enum import Enum
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DDL, Column, DateTime, ForeignKey, Index, Integer, String, Text, event, func, text
 from sqlalchemy import Enum as SAEnum
 from sqlmodel import Field, SQLModel
 
@@ -72,11 +72,19 @@ PRIORITY_MATRIX: dict[tuple[IncidentImpact, IncidentUrgency], IncidentPriority]
 }
 
 
+# Same matrix nested by impact → urgency: two dict probes on the members,
+# no (impact, urgency) tuple to allocate and hash per call.
+_PRIORITY_BY_IMPACT: dict[IncidentImpact, dict[IncidentUrgency, IncidentPriority]] = {
+    impact: {urgency: PRIORITY_MATRIX[(impact, urgency)] for urgency in IncidentUrgency}
+    for impact in IncidentImpact
+}
+
+
 def compute_priority(
     impact: IncidentImpact, urgency: IncidentUrgency
 ) -> IncidentPriority:
     """Derive priority from the ITIL Impact × Urgency matrix."""
-    return PRIORITY_MATRIX[(impact, urgency)]
+    return _PRIORITY_BY_IMPACT[impact][urgency]
 
 
 # ── Incident Model ───────────────────────────────────────────────
@@ -89,13 +97,29 @@ class Incident(SQLModel, table=True):
     """
 
     __tablename__ = "incidents"
+    # Fetch server-generated timestamps via RETURNING on INSERT/UPDATE,
+    # so flushed instances never need a lazy reload
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Composite indexes matching list_by_org's filter + sort combinations;
+        # the (organization_id, created_at) one also covers plain org lookups.
+        Index("ix_incidents_org_created", "organization_id", text("created_at DESC")),
+        Index("ix_incidents_org_status", "organization_id", "status"),
+        Index("ix_incidents_org_assigned", "organization_id", "assigned_to"),
+        Index("ix_incidents_org_priority_status", "organization_id", "priority", "status"),
+        # Most incidents have no service; only index the ones that do
+        Index(
+            "ix_incidents_service_id",
+            "service_id",
+            postgresql_where=text("service_id IS NOT NULL"),
+        ),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     organization_id: uuid.UUID = Field(
         sa_column=Column(
             ForeignKey("organizations.id", ondelete="CASCADE"),
             nullable=False,
-            index=True,
         )
     )
     incident_number: str = Field(
@@ -108,32 +132,43 @@ class Incident(SQLModel, table=True):
         default=None, sa_column=Column(Text, nullable=True)
     )
 
-    # ITIL classification
+    # ITIL classification. Defaults live in the database; the Postgres enum
+    # labels are the member names (SAEnum's default), hence `.name`.
     status: IncidentStatus = Field(
         sa_column=Column(
-            SAEnum(IncidentStatus), nullable=False, default=IncidentStatus.OPEN
+            SAEnum(IncidentStatus),
+            nullable=False,
+            server_default=IncidentStatus.OPEN.name,
         )
     )
     impact: IncidentImpact = Field(
         sa_column=Column(
-            SAEnum(IncidentImpact), nullable=False, default=IncidentImpact.MEDIUM
+            SAEnum(IncidentImpact),
+            nullable=False,
+            server_default=IncidentImpact.MEDIUM.name,
         )
     )
     urgency: IncidentUrgency = Field(
         sa_column=Column(
-            SAEnum(IncidentUrgency), nullable=False, default=IncidentUrgency.MEDIUM
+            SAEnum(IncidentUrgency),
+            nullable=False,
+            server_default=IncidentUrgency.MEDIUM.name,
         )
     )
     priority: IncidentPriority = Field(
         sa_column=Column(
-            SAEnum(IncidentPriority), nullable=False, default=IncidentPriority.P3
+            SAEnum(IncidentPriority),
+            nullable=False,
+            server_default=IncidentPriority.P3.name,
         )
     )
     category: str | None = Field(default=None, max_length=100)
     subcategory: str | None = Field(default=None, max_length=100)
     source: IncidentSource = Field(
         sa_column=Column(
-            SAEnum(IncidentSource), nullable=False, default=IncidentSource.PORTAL
+            SAEnum(IncidentSource),
+            nullable=False,
+            server_default=IncidentSource.PORTAL.name,
         )
     )
 
@@ -142,7 +177,6 @@ class Incident(SQLModel, table=True):
         sa_column=Column(
             ForeignKey("services.id", ondelete="SET NULL"),
             nullable=True,
-            index=True,
         )
     )
     assigned_to: uuid.UUID | None = Field(
@@ -184,16 +218,130 @@ class Incident(SQLModel, table=True):
     )
     created_at: datetime = Field(
         sa_column=Column(
-            DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+            DateTime(timezone=True),
+            default=lambda: datetime.now(timezone.utc),
+            server_default=func.now(),
         )
     )
     updated_at: datetime = Field(
         sa_column=Column(
             DateTime(timezone=True),
             default=lambda: datetime.now(timezone.utc),
-            onupdate=lambda: datetime.now(timezone.utc),
+            server_default=func.now(),
+            onupdate=func.now(),
+        )
+    )
+
+
+# ── Numbering Counter ────────────────────────────────────────────
+
+
+class IncidentCounter(SQLModel, table=True):
+    """
+    Per-organization incident number sequence.
+    Bumped atomically with an UPSERT so numbering never scans incidents.
+    """
+
+    __tablename__ = "incident_counters"
+
+    organization_id: uuid.UUID = Field(
+        sa_column=Column(
+            ForeignKey("organizations.id", ondelete="CASCADE"),
+            primary_key=True,
+        )
+    )
+    last_number: int = Field(
+        default=0, sa_column=Column(Integer, nullable=False, default=0)
+    )
+
+
+# When create_all adds the counters to a database that already has incidents,
+# continue each org's numbering from its current count (as the migration does)
+IncidentCounter.__table__.add_is_dependent_on(Incident.__table__)
+event.listen(
+    IncidentCounter.__table__,
+    "after_create",
+    DDL(
+        "INSERT INTO incident_counters (organization_id, last_number) "
+        "SELECT organization_id, count(*) FROM incidents GROUP BY organization_id"
+    ).execute_if(dialect="postgresql"),
+)
+
+
+# ── Dashboard Rollup ─────────────────────────────────────────────
+
+
+class IncidentStatCount(SQLModel, table=True):
+    """
+    Incident counts per (organization, status, priority).
+    Maintained by a trigger on 'incidents' so dashboard stats read a handful
+    of rows instead of counting every incident.
+    """
+
+    __tablename__ = "incident_stat_counts"
+
+    organization_id: uuid.UUID = Field(
+        sa_column=Column(
+            ForeignKey("organizations.id", ondelete="CASCADE"),
+            primary_key=True,
         )
     )
+    status: IncidentStatus = Field(
+        sa_column=Column(SAEnum(IncidentStatus), primary_key=True)
+    )
+    priority: IncidentPriority = Field(
+        sa_column=Column(SAEnum(IncidentPriority), primary_key=True)
+    )
+    count: int = Field(
+        default=0, sa_column=Column(Integer, nullable=False, default=0)
+    )
+
+
+# Keeps incident_stat_counts in step with every incident write
+_STAT_COUNTS_FUNCTION = """
+CREATE OR REPLACE FUNCTION incident_stat_counts_sync() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE incident_stat_counts SET count = count - 1
+        WHERE organization_id = OLD.organization_id
+          AND status = OLD.status
+          AND priority = OLD.priority;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO incident_stat_counts (organization_id, status, priority, count)
+        VALUES (NEW.organization_id, NEW.status, NEW.priority, 1)
+        ON CONFLICT (organization_id, status, priority)
+        DO UPDATE SET count = incident_stat_counts.count + 1;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+_STAT_COUNTS_TRIGGER = """
+CREATE TRIGGER incidents_stat_counts
+AFTER INSERT OR DELETE OR UPDATE OF organization_id, status, priority ON incidents
+FOR EACH ROW EXECUTE FUNCTION incident_stat_counts_sync()
+"""
+
+# When create_all (init_db) adds the rollup — fresh or upgraded database —
+# install the trigger and backfill in the same transaction, as the migration
+# does. Ordered after incidents, which the trigger and backfill read.
+IncidentStatCount.__table__.add_is_dependent_on(Incident.__table__)
+for _ddl in (
+    _STAT_COUNTS_FUNCTION,
+    _STAT_COUNTS_TRIGGER,
+    """
+    INSERT INTO incident_stat_counts (organization_id, status, priority, count)
+    SELECT organization_id, status, priority, count(*)
+    FROM incidents
+    GROUP BY organization_id, status, priority
+    """,
+):
+    event.listen(
+        IncidentStatCount.__table__,
+        "after_create",
+        DDL(_ddl).execute_if(dialect="postgresql"),
+    )
 
 
 # ── Attachment Model ─────────────────────────────────────────────
@@ -230,6 +378,8 @@ class IncidentAttachment(SQLModel, table=True):
     )
     created_at: datetime = Field(
         sa_column=Column(
-            DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+            DateTime(timezone=True),
+            default=lambda: datetime.now(timezone.utc),
+            server_default=func.now(),
         )
     )
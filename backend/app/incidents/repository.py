@@ -3,21 +3,42 @@ Incident repository — database operations for incidents and attachments.
 """
 
 import uuid
+from datetime import datetime, timezone
 
-from sqlalchemy import func
+from sqlalchemy import Row, delete, literal, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from app.incidents.models import (
     Incident,
     IncidentAttachment,
+    IncidentCounter,
     IncidentImpact,
     IncidentPriority,
     IncidentSource,
+    IncidentStatCount,
     IncidentStatus,
     IncidentUrgency,
 )
 
+# Columns shown by the incident table (IncidentListItem); skips the TEXT fields
+_LIST_COLUMNS = (
+    Incident.id,
+    Incident.incident_number,
+    Incident.title,
+    Incident.status,
+    Incident.impact,
+    Incident.urgency,
+    Incident.priority,
+    Incident.category,
+    Incident.source,
+    Incident.service_id,
+    Incident.assigned_to,
+    Incident.reported_by,
+    Incident.created_at,
+)
+
 
 class IncidentRepository:
     """Repository for Incident CRUD operations."""
@@ -35,13 +56,28 @@ class IncidentRepository:
         priority: IncidentPriority | None = None,
         service_id: uuid.UUID | None = None,
         assigned_to: uuid.UUID | None = None,
-    ) -> list[Incident]:
-        """List incidents for an organization with optional filters."""
+        limit: int | None = None,
+        after: tuple[datetime, uuid.UUID] | None = None,
+    ) -> tuple[list[Row], tuple[datetime, uuid.UUID] | None]:
+        """
+        List incidents for an organization, newest first.
+        With a `limit`, keyset-paginated on (created_at, id): returns the page
+        and the key to pass as `after` for the next one (None on the last
+        page). Without one, returns every match.
+
+        Projects only the list columns — description, diagnosis, solution
+        and resolution notes never leave the database.
+        """
         statement = (
-            select(Incident)
+            select(*_LIST_COLUMNS)
             .where(Incident.organization_id == org_id)
-            .order_by(Incident.created_at.desc())
+            .order_by(Incident.created_at.desc(), Incident.id.desc())
         )
+        if limit is not None:
+            # One extra row tells us whether another page exists
+            statement = statement.limit(limit + 1)
+        if after is not None:
+            statement = statement.where(tuple_(Incident.created_at, Incident.id) < after)
         if status is not None:
             statement = statement.where(Incident.status == status)
         if priority is not None:
@@ -52,43 +88,81 @@ class IncidentRepository:
             statement = statement.where(Incident.assigned_to == assigned_to)
 
         result = await self.session.execute(statement)
-        return list(result.scalars().all())
+        incidents = list(result.all())
+        if limit is None or len(incidents) <= limit:
+            return incidents, None
+        del incidents[limit:]
+        last = incidents[-1]
+        return incidents, (last.created_at, last.id)
 
     async def get_by_id(
         self, org_id: uuid.UUID, incident_id: uuid.UUID
     ) -> Incident | None:
-        """Get a single incident by ID within an organization."""
-        statement = select(Incident).where(
-            Incident.id == incident_id,
-            Incident.organization_id == org_id,
+        """
+        Get a single incident by ID within an organization.
+        Primary-key get: served from the identity map when already loaded.
+        """
+        incident = await self.session.get(Incident, incident_id)
+        if incident is None or incident.organization_id != org_id:
+            return None
+        return incident
+
+    async def get_with_attachments(
+        self, org_id: uuid.UUID, incident_id: uuid.UUID
+    ) -> tuple[Incident | None, list[IncidentAttachment]]:
+        """
+        Get an incident and its attachments in one round trip.
+        LEFT JOIN on attachments: the incident repeats once per attachment
+        (or once with a NULL attachment when there are none).
+        """
+        statement = (
+            select(Incident, IncidentAttachment)
+            .outerjoin(
+                IncidentAttachment, IncidentAttachment.incident_id == Incident.id
+            )
+            .where(
+                Incident.id == incident_id,
+                Incident.organization_id == org_id,
+            )
+            .order_by(IncidentAttachment.created_at)
         )
-        result = await self.session.execute(statement)
-        return result.scalar_one_or_none()
+        rows = (await self.session.execute(statement)).all()
+        if not rows:
+            return None, []
+        return rows[0][0], [a for _, a in rows if a is not None]
 
     async def create(self, incident: Incident) -> Incident:
-        """Insert a new incident."""
-        self.session.add(incident)
-        await self.session.flush()
-        await self.session.refresh(incident)
-        return incident
+        """Insert a new incident (INSERT ... RETURNING, no follow-up SELECT)."""
+        values = incident.model_dump(exclude_none=True)
+        now = datetime.now(timezone.utc)
+        values.setdefault("created_at", now)
+        values.setdefault("updated_at", now)
+        statement = insert(Incident).values(**values).returning(Incident)
+        result = await self.session.execute(statement)
+        return result.scalar_one()
 
     async def update(self, incident: Incident) -> Incident:
-        """Persist changes to an existing incident."""
+        """
+        Persist changes to an existing incident.
+        updated_at comes back via UPDATE ... RETURNING (eager_defaults), so
+        the flushed instance is already current — no refresh SELECT.
+        """
         self.session.add(incident)
         await self.session.flush()
-        await self.session.refresh(incident)
         return incident
 
     async def get_next_number(self, org_id: uuid.UUID) -> str:
         """Generate next incident number for an org (INC-001, INC-002, ...)."""
-        statement = (
-            select(func.count())
-            .select_from(Incident)
-            .where(Incident.organization_id == org_id)
+        # Single-row UPSERT: the row lock serializes concurrent creates per org
+        statement = insert(IncidentCounter).values(
+            organization_id=org_id, last_number=1
         )
-        result = await self.session.execute(statement)
-        count = (result.scalar() or 0) + 1
-        return f"INC-{count:03d}"
+        statement = statement.on_conflict_do_update(
+            index_elements=[IncidentCounter.organization_id],
+            set_={"last_number": IncidentCounter.last_number + 1},
+        ).returning(IncidentCounter.last_number)
+        number = (await self.session.execute(statement)).scalar_one()
+        return f"INC-{number:03d}"
 
     # ── Attachment Queries ────────────────────────────────────────
 
@@ -105,13 +179,30 @@ class IncidentRepository:
         return list(result.scalars().all())
 
     async def add_attachment(
-        self, attachment: IncidentAttachment
-    ) -> IncidentAttachment:
-        """Save attachment metadata."""
-        self.session.add(attachment)
-        await self.session.flush()
-        await self.session.refresh(attachment)
-        return attachment
+        self, org_id: uuid.UUID, attachment: IncidentAttachment
+    ) -> IncidentAttachment | None:
+        """
+        Save attachment metadata if its incident exists in the organization.
+
+        INSERT ... SELECT from the incident row, so the tenant check and the
+        write are one statement; returns None when no such incident exists.
+        """
+        values = attachment.model_dump(exclude_none=True)
+        values.setdefault("created_at", datetime.now(timezone.utc))
+        columns = IncidentAttachment.__table__.c
+        source = select(
+            *(literal(value, columns[name].type) for name, value in values.items())
+        ).where(
+            Incident.id == attachment.incident_id,
+            Incident.organization_id == org_id,
+        )
+        statement = (
+            insert(IncidentAttachment)
+            .from_select(list(values), source)
+            .returning(IncidentAttachment)
+        )
+        result = await self.session.execute(statement)
+        return result.scalar_one_or_none()
 
     async def get_attachment(
         self, attachment_id: uuid.UUID
@@ -123,34 +214,49 @@ class IncidentRepository:
         result = await self.session.execute(statement)
         return result.scalar_one_or_none()
 
-    async def delete_attachment(self, attachment: IncidentAttachment) -> None:
-        """Delete attachment metadata."""
-        await self.session.delete(attachment)
-        await self.session.flush()
-
-    # ── Stats ─────────────────────────────────────────────────────
-
-    async def count_by_status(
-        self, org_id: uuid.UUID
-    ) -> dict[str, int]:
-        """Count incidents grouped by status (for dashboard)."""
+    async def delete_attachment(
+        self,
+        org_id: uuid.UUID,
+        incident_id: uuid.UUID,
+        attachment_id: uuid.UUID,
+    ) -> bool:
+        """
+        Delete attachment metadata, scoped to its incident and organization.
+        Single DELETE ... RETURNING; False if nothing matched.
+        """
+        in_org = (
+            select(Incident.id)
+            .where(Incident.id == incident_id, Incident.organization_id == org_id)
+            .exists()
+        )
         statement = (
-            select(Incident.status, func.count())
-            .where(Incident.organization_id == org_id)
-            .group_by(Incident.status)
+            delete(IncidentAttachment)
+            .where(
+                IncidentAttachment.id == attachment_id,
+                IncidentAttachment.incident_id == incident_id,
+                in_org,
+            )
+            .returning(IncidentAttachment.id)
         )
         result = await self.session.execute(statement)
-        return {row[0].value: row[1] for row in result.all()}
+        return result.scalar_one_or_none() is not None
+
+    # ── Stats ─────────────────────────────────────────────────────
 
-    async def count_by_priority(
+    async def count_by_status_and_priority(
         self, org_id: uuid.UUID
-    ) -> dict[str, int]:
-        """Count incidents grouped by priority (for dashboard)."""
-        statement = (
-            select(Incident.priority, func.count())
-            .where(Incident.organization_id == org_id)
-            .where(Incident.status.notin_([IncidentStatus.CLOSED, IncidentStatus.RESOLVED]))
-            .group_by(Incident.priority)
+    ) -> list[tuple[IncidentStatus, IncidentPriority, int]]:
+        """
+        Count incidents grouped by (status, priority) (for dashboard).
+        Reads the trigger-maintained rollup: at most one row per bucket.
+        """
+        statement = select(
+            IncidentStatCount.status,
+            IncidentStatCount.priority,
+            IncidentStatCount.count,
+        ).where(
+            IncidentStatCount.organization_id == org_id,
+            IncidentStatCount.count > 0,
         )
         result = await self.session.execute(statement)
-        return {row[0].value: row[1] for row in result.all()}
+        return [tuple(row) for row in result.all()]
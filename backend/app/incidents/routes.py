@@ -5,7 +5,8 @@ All endpoints are org-scoped via verify_organization_access.
 
 import uuid
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
+from pydantic import TypeAdapter
 
 from app.auth.models.membership import UserOrganization
 from app.auth.models.organization import Organization
@@ -16,32 +17,49 @@ from app.incidents.schemas import (
     IncidentCreate,
     IncidentListItem,
     IncidentResponse,
+    IncidentStats,
     IncidentUpdate,
 )
 
 router = APIRouter(prefix="/orgs/{organization_slug}/incidents", tags=["Incidents"])
 
+# Built once: validates a whole attachment list in a single core call
+_ATTACHMENTS_ADAPTER = TypeAdapter(list[AttachmentResponse])
+
 
 @router.get("", response_model=list[IncidentListItem])
 async def list_incidents(
+    response: Response,
     status: str | None = None,
     priority: str | None = None,
     service_id: uuid.UUID | None = None,
     assigned_to: uuid.UUID | None = None,
+    limit: int | None = Query(None, ge=1, le=200),
+    cursor: str | None = None,
     org_access: tuple[Organization, UserOrganization] = Depends(
         verify_organization_access
     ),
     svc: object = Depends(get_incident_service),
 ):
-    """List incidents with optional filters."""
+    """
+    List incidents with optional filters, newest first.
+    Pass `limit` to paginate: send the X-Next-Cursor response header back
+    as `cursor`. Without it every incident is returned.
+    """
     org, _ = org_access
-    return await svc.list_incidents(
+    incidents, next_cursor = await svc.list_incidents(
         org.id,
         status=status,
         priority=priority,
         service_id=service_id,
         assigned_to=assigned_to,
+        limit=limit,
+        cursor=cursor,
     )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    # Rows are projected straight from typed columns; skip re-validation
+    return [IncidentListItem.model_construct(**row._mapping) for row in incidents]
 
 
 @router.post("", response_model=IncidentResponse, status_code=201)
@@ -50,16 +68,16 @@ async def create_incident(
     org_access: tuple[Organization, UserOrganization] = Depends(
         verify_organization_access
     ),
-    user_id: str = Depends(get_current_user_id),
+    user_id: uuid.UUID = Depends(get_current_user_id),
     svc: object = Depends(get_incident_service),
 ):
     """Create a new incident."""
     org, _ = org_access
-    incident = await svc.create_incident(org.id, uuid.UUID(user_id), data)
+    incident = await svc.create_incident(org.id, user_id, data)
     return incident
 
 
-@router.get("/stats")
+@router.get("/stats", response_model=IncidentStats)
 async def get_incident_stats(
     org_access: tuple[Organization, UserOrganization] = Depends(
         verify_organization_access
@@ -85,9 +103,9 @@ async def get_incident(
         org.id, incident_id
     )
     response = IncidentResponse.model_validate(incident)
-    response.attachments = [
-        AttachmentResponse.model_validate(a) for a in attachments
-    ]
+    response.attachments = _ATTACHMENTS_ADAPTER.validate_python(
+        attachments, from_attributes=True
+    )
     return response
 
 
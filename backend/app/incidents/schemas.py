@@ -116,3 +116,11 @@ class IncidentListItem(BaseModel):
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class IncidentStats(BaseModel):
+    """Dashboard incident counters."""
+
+    by_status: dict[str, int]
+    by_priority: dict[str, int]
+    total_open: int
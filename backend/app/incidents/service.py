@@ -3,32 +3,47 @@ Incident Management business logic.
 Handles status transitions (state machine), priority computation, and numbering.
 """
 
+import base64
+import binascii
 import uuid
 from datetime import datetime, timezone
 
+from cachetools import TTLCache
+from sqlalchemy import Row
+
+from app.core.database import after_commit
 from app.core.exceptions import NotFoundError, ValidationError
 from app.incidents.models import (
     Incident,
     IncidentAttachment,
-    IncidentImpact,
     IncidentPriority,
     IncidentStatus,
-    IncidentUrgency,
     compute_priority,
 )
 from app.incidents.repository import IncidentRepository
 from app.incidents.schemas import IncidentCreate, IncidentUpdate
 
 
-# Valid status transitions (state machine)
-VALID_TRANSITIONS: dict[IncidentStatus, set[IncidentStatus]] = {
-    IncidentStatus.OPEN: {IncidentStatus.ACKNOWLEDGED, IncidentStatus.INVESTIGATING, IncidentStatus.RESOLVED, IncidentStatus.CLOSED},
-    IncidentStatus.ACKNOWLEDGED: {IncidentStatus.INVESTIGATING, IncidentStatus.RESOLVED, IncidentStatus.CLOSED},
-    IncidentStatus.INVESTIGATING: {IncidentStatus.RESOLVED, IncidentStatus.CLOSED},
-    IncidentStatus.RESOLVED: {IncidentStatus.CLOSED, IncidentStatus.OPEN},  # Reopen allowed
-    IncidentStatus.CLOSED: {IncidentStatus.OPEN},  # Reopen allowed
+# Valid status transitions (state machine); frozen, every status has an entry
+VALID_TRANSITIONS: dict[IncidentStatus, frozenset[IncidentStatus]] = {
+    IncidentStatus.OPEN: frozenset({IncidentStatus.ACKNOWLEDGED, IncidentStatus.INVESTIGATING, IncidentStatus.RESOLVED, IncidentStatus.CLOSED}),
+    IncidentStatus.ACKNOWLEDGED: frozenset({IncidentStatus.INVESTIGATING, IncidentStatus.RESOLVED, IncidentStatus.CLOSED}),
+    IncidentStatus.INVESTIGATING: frozenset({IncidentStatus.RESOLVED, IncidentStatus.CLOSED}),
+    IncidentStatus.RESOLVED: frozenset({IncidentStatus.CLOSED, IncidentStatus.OPEN}),  # Reopen allowed
+    IncidentStatus.CLOSED: frozenset({IncidentStatus.OPEN}),  # Reopen allowed
 }
 
+# Statuses excluded from the open-work dashboard counts
+_CLOSED_STATUSES = frozenset({IncidentStatus.RESOLVED, IncidentStatus.CLOSED})
+# Dashboard stats per org, for polling clients. Writes through this worker
+# drop their org's entry once committed (earlier, a concurrent poll could
+# re-cache the old counts); other workers' writes show up within the TTL.
+_stats_cache: TTLCache[uuid.UUID, dict] = TTLCache(maxsize=1024, ttl=30)
+
+# Enum member → wire string, built once (dict lookup instead of .value per row)
+_STATUS_VALUES = {s: s.value for s in IncidentStatus}
+_PRIORITY_VALUES = {p: p.value for p in IncidentPriority}
+
 
 class IncidentService:
     """Business logic for incident management."""
@@ -46,14 +61,19 @@ class IncidentService:
         priority: str | None = None,
         service_id: uuid.UUID | None = None,
         assigned_to: uuid.UUID | None = None,
-    ) -> list[Incident]:
-        """List incidents with optional filters."""
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[Row], str | None]:
+        """List a page of incidents with optional filters, plus the next-page cursor."""
         s = IncidentStatus(status) if status else None
         p = IncidentPriority(priority) if priority else None
-        return await self.repo.list_by_org(
+        after = self._decode_cursor(cursor) if cursor else None
+        incidents, next_key = await self.repo.list_by_org(
             org_id, status=s, priority=p,
             service_id=service_id, assigned_to=assigned_to,
+            limit=limit, after=after,
         )
+        return incidents, self._encode_cursor(*next_key) if next_key else None
 
     async def get_incident(
         self, org_id: uuid.UUID, incident_id: uuid.UUID
@@ -68,8 +88,11 @@ class IncidentService:
         self, org_id: uuid.UUID, incident_id: uuid.UUID
     ) -> tuple[Incident, list[IncidentAttachment]]:
         """Get incident + its attachments for detail view."""
-        incident = await self.get_incident(org_id, incident_id)
-        attachments = await self.repo.list_attachments(incident_id)
+        incident, attachments = await self.repo.get_with_attachments(
+            org_id, incident_id
+        )
+        if incident is None:
+            raise NotFoundError("Incident")
         return incident, attachments
 
     # ── Commands ───────────────────────────────────────────────────
@@ -100,7 +123,9 @@ class IncidentService:
             assigned_to=data.assigned_to,
             reported_by=reported_by,
         )
-        return await self.repo.create(incident)
+        created = await self.repo.create(incident)
+        after_commit(self.repo.session, lambda: _stats_cache.pop(org_id, None))
+        return created
 
     async def update_incident(
         self,
@@ -111,28 +136,34 @@ class IncidentService:
         """Partial-update with status transition validation and priority recomputation."""
         incident = await self.get_incident(org_id, incident_id)
         update_data = data.model_dump(exclude_unset=True)
+        # Nothing differs from what is stored: skip the flush entirely.
+        # A same-status PATCH still goes through (and fails) validation below.
+        if "status" not in update_data and all(
+            getattr(incident, field) == value for field, value in update_data.items()
+        ):
+            return incident
         now = datetime.now(timezone.utc)
 
         # Validate status transition
         if "status" in update_data:
-            new_status = IncidentStatus(update_data["status"])
+            new_status = update_data["status"]
             self._validate_transition(incident.status, new_status)
             self._apply_status_timestamps(incident, new_status, now)
 
         # Recompute priority if impact or urgency changed
-        new_impact = update_data.get("impact", incident.impact)
-        new_urgency = update_data.get("urgency", incident.urgency)
+        # IncidentUpdate already yields enum members, no str coercion needed
         if "impact" in update_data or "urgency" in update_data:
-            if isinstance(new_impact, str):
-                new_impact = IncidentImpact(new_impact)
-            if isinstance(new_urgency, str):
-                new_urgency = IncidentUrgency(new_urgency)
-            update_data["priority"] = compute_priority(new_impact, new_urgency)
+            update_data["priority"] = compute_priority(
+                update_data.get("impact", incident.impact),
+                update_data.get("urgency", incident.urgency),
+            )
 
         for field, value in update_data.items():
             setattr(incident, field, value)
 
-        return await self.repo.update(incident)
+        updated = await self.repo.update(incident)
+        after_commit(self.repo.session, lambda: _stats_cache.pop(org_id, None))
+        return updated
 
     # ── Attachments ────────────────────────────────────────────────
 
@@ -148,9 +179,6 @@ class IncidentService:
         uploaded_by: uuid.UUID,
     ) -> IncidentAttachment:
         """Add an attachment to an incident."""
-        # Verify incident exists
-        await self.get_incident(org_id, incident_id)
-
         attachment = IncidentAttachment(
             incident_id=incident_id,
             filename=filename,
@@ -159,7 +187,10 @@ class IncidentService:
             storage_path=storage_path,
             uploaded_by=uploaded_by,
         )
-        return await self.repo.add_attachment(attachment)
+        created = await self.repo.add_attachment(org_id, attachment)
+        if created is None:
+            raise NotFoundError("Incident")
+        return created
 
     async def delete_attachment(
         self,
@@ -168,36 +199,61 @@ class IncidentService:
         attachment_id: uuid.UUID,
     ) -> None:
         """Delete an attachment from an incident."""
-        await self.get_incident(org_id, incident_id)
-        attachment = await self.repo.get_attachment(attachment_id)
-        if attachment is None or attachment.incident_id != incident_id:
+        if not await self.repo.delete_attachment(org_id, incident_id, attachment_id):
             raise NotFoundError("Attachment")
-        await self.repo.delete_attachment(attachment)
 
     # ── Dashboard Stats ────────────────────────────────────────────
 
     async def get_stats(self, org_id: uuid.UUID) -> dict:
-        """Get dashboard statistics."""
-        by_status = await self.repo.count_by_status(org_id)
-        by_priority = await self.repo.count_by_priority(org_id)
-        return {
+        """Get dashboard statistics (cached briefly per org)."""
+        cached = _stats_cache.get(org_id)
+        if cached is not None:
+            return cached
+        by_status: dict[str, int] = {}
+        by_priority: dict[str, int] = {}
+        total_open = 0
+        # One GROUP BY (status, priority) folded into both breakdowns
+        for status, priority, count in await self.repo.count_by_status_and_priority(org_id):
+            key = _STATUS_VALUES[status]
+            by_status[key] = by_status.get(key, 0) + count
+            if status in _CLOSED_STATUSES:
+                continue
+            key = _PRIORITY_VALUES[priority]
+            by_priority[key] = by_priority.get(key, 0) + count
+            total_open += count
+        stats = {
             "by_status": by_status,
             "by_priority": by_priority,
-            "total_open": sum(
-                v for k, v in by_status.items()
-                if k not in ("resolved", "closed")
-            ),
+            "total_open": total_open,
         }
+        _stats_cache[org_id] = stats
+        return stats
 
     # ── Helpers ────────────────────────────────────────────────────
 
+    @staticmethod
+    def _encode_cursor(created_at: datetime, incident_id: uuid.UUID) -> str:
+        """Opaque page cursor for the (created_at, id) keyset."""
+        raw = f"{created_at.isoformat()}|{incident_id}".encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+        """Inverse of _encode_cursor; rejects anything it did not produce."""
+        try:
+            created_at, _, incident_id = (
+                base64.urlsafe_b64decode(cursor).decode().partition("|")
+            )
+            return datetime.fromisoformat(created_at), uuid.UUID(incident_id)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValidationError("Invalid pagination cursor")
+
     @staticmethod
     def _validate_transition(
         current: IncidentStatus, target: IncidentStatus
     ) -> None:
         """Enforce the status state machine."""
-        allowed = VALID_TRANSITIONS.get(current, set())
-        if target not in allowed:
+        if target not in VALID_TRANSITIONS[current]:
             raise ValidationError(
                 f"Cannot transition from '{current.value}' to '{target.value}'"
             )
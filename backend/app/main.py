@@ -7,19 +7,17 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
 
 from app.auth.router import router as auth_router
 from app.incidents.routes import router as incidents_router
 from app.services.routes import router as services_router
 from app.core.database import init_db
 from app.core.exception_handlers import register_exception_handlers
-from app.core.middleware import SecurityHeadersMiddleware
-
-# Rate limiter instance
-limiter = Limiter(key_func=get_remote_address)
+from app.core.middleware import HealthCheckMiddleware, SecurityHeadersMiddleware
+from app.core.rate_limit import limiter
+from app.core.security import shutdown_hash_executor
 
 
 @asynccontextmanager
@@ -28,6 +26,7 @@ async def lifespan(app: FastAPI):
     await init_db()
     print("Database initialized")
     yield
+    shutdown_hash_executor()
     print("Shutting down Sentinel Core")
 
 
@@ -61,8 +60,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+# Health probes short-circuit the stack above (must be added last)
+app.add_middleware(HealthCheckMiddleware)
+
 # Mount feature routers
 app.include_router(auth_router, prefix="/api")
 app.include_router(incidents_router, prefix="/api")
@@ -77,7 +80,7 @@ def read_root():
 
 @app.get("/health", tags=["Health"])
 def health_check():
-    """Health check endpoint."""
+    """Health check endpoint (served by HealthCheckMiddleware; kept for the docs)."""
     return {"status": "operational"}
 
 
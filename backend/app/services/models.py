@@ -39,6 +39,11 @@ class ServiceLifecycle(str, Enum):
     RETIRED = "retired"     # Decommissioned
 
 
+def _utcnow() -> datetime:
+    """Timestamp default shared by the created_at/updated_at columns."""
+    return datetime.now(timezone.utc)
+
+
 class Service(SQLModel, table=True):
     """
     IT Service in the service catalog.
@@ -90,13 +95,13 @@ class Service(SQLModel, table=True):
     documentation_url: str | None = Field(default=None, max_length=512)
     created_at: datetime = Field(
         sa_column=Column(
-            DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+            DateTime(timezone=True), default=_utcnow
         )
     )
     updated_at: datetime = Field(
         sa_column=Column(
             DateTime(timezone=True),
-            default=lambda: datetime.now(timezone.utc),
-            onupdate=lambda: datetime.now(timezone.utc),
+            default=_utcnow,
+            onupdate=_utcnow,
         )
     )
@@ -4,12 +4,25 @@ Service Catalog repository — database operations for services.
 
 import uuid
 
-from sqlalchemy import func
+from sqlalchemy import Row, or_, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from app.services.models import Service, ServiceLifecycle
 
+# Columns shown by the catalog list (ServiceListItem); skips description etc.
+_LIST_COLUMNS = (
+    Service.id,
+    Service.name,
+    Service.slug,
+    Service.status,
+    Service.tier,
+    Service.lifecycle,
+    Service.category,
+    Service.owner_id,
+    Service.created_at,
+)
+
 
 class ServiceRepository:
     """Repository for Service CRUD operations."""
@@ -21,28 +34,49 @@ class ServiceRepository:
         self,
         org_id: uuid.UUID,
         lifecycle: ServiceLifecycle | None = None,
-    ) -> list[Service]:
-        """List all services for an organization, optionally filtered by lifecycle."""
+        *,
+        limit: int | None = None,
+        after: tuple[str, uuid.UUID] | None = None,
+    ) -> tuple[list[Row], tuple[str, uuid.UUID] | None]:
+        """
+        List services for an organization, optionally filtered by lifecycle.
+        With a `limit`, keyset-paginated on (name, id): returns the page and
+        the key to pass as `after` for the next one (None on the last page).
+        Without one, returns every match.
+
+        Projects only the list columns — no ORM entities, no TEXT fields.
+        """
         statement = (
-            select(Service)
+            select(*_LIST_COLUMNS)
             .where(Service.organization_id == org_id)
-            .order_by(Service.name)
+            .order_by(Service.name, Service.id)
         )
+        if limit is not None:
+            # One extra row tells us whether another page exists
+            statement = statement.limit(limit + 1)
+        if after is not None:
+            statement = statement.where(tuple_(Service.name, Service.id) > after)
         if lifecycle is not None:
             statement = statement.where(Service.lifecycle == lifecycle)
         result = await self.session.execute(statement)
-        return list(result.scalars().all())
+        services = list(result.all())
+        if limit is None or len(services) <= limit:
+            return services, None
+        del services[limit:]
+        last = services[-1]
+        return services, (last.name, last.id)
 
     async def get_by_id(
         self, org_id: uuid.UUID, service_id: uuid.UUID
     ) -> Service | None:
-        """Get a service by ID within an organization."""
-        statement = select(Service).where(
-            Service.id == service_id,
-            Service.organization_id == org_id,
-        )
-        result = await self.session.execute(statement)
-        return result.scalar_one_or_none()
+        """
+        Get a service by ID within an organization.
+        Primary-key get: served from the identity map when already loaded.
+        """
+        service = await self.session.get(Service, service_id)
+        if service is None or service.organization_id != org_id:
+            return None
+        return service
 
     async def get_by_slug(
         self, org_id: uuid.UUID, slug: str
@@ -74,11 +108,30 @@ class ServiceRepository:
         await self.session.delete(service)
         await self.session.flush()
 
+    async def list_slugs_with_prefix(
+        self, org_id: uuid.UUID, base_slug: str
+    ) -> set[str]:
+        """Slugs in an organization equal to `base_slug` or starting with `base_slug-`."""
+        statement = select(Service.slug).where(
+            Service.organization_id == org_id,
+            or_(
+                Service.slug == base_slug,
+                Service.slug.startswith(f"{base_slug}-", autoescape=True),
+            ),
+        )
+        result = await self.session.execute(statement)
+        return set(result.scalars().all())
+
     async def slug_exists(self, org_id: uuid.UUID, slug: str) -> bool:
         """Check if a slug is already taken within an organization."""
-        statement = select(func.count()).where(
-            Service.organization_id == org_id,
-            Service.slug == slug,
+        # EXISTS stops at the first match on the (organization_id, slug) index
+        statement = select(
+            select(Service.id)
+            .where(
+                Service.organization_id == org_id,
+                Service.slug == slug,
+            )
+            .exists()
         )
         result = await self.session.execute(statement)
-        return (result.scalar() or 0) > 0
+        return bool(result.scalar())
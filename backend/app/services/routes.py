@@ -5,7 +5,7 @@ All endpoints are org-scoped via verify_organization_access.
 
 import uuid
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
 
 from app.auth.models.organization import Organization
 from app.auth.models.membership import UserOrganization
@@ -23,15 +23,26 @@ router = APIRouter(prefix="/orgs/{organization_slug}/services", tags=["Services"
 
 @router.get("", response_model=list[ServiceListItem])
 async def list_services(
+    response: Response,
     lifecycle: str | None = None,
+    limit: int | None = Query(None, ge=1, le=200),
+    cursor: str | None = None,
     org_access: tuple[Organization, UserOrganization] = Depends(
         verify_organization_access
     ),
     svc: object = Depends(get_service_service),
 ):
-    """List all services in the organization."""
+    """
+    List services in the organization, by name.
+    Pass `limit` to paginate: send the X-Next-Cursor response header back
+    as `cursor`. Without it every service is returned.
+    """
     org, _ = org_access
-    services = await svc.list_services(org.id, lifecycle=lifecycle)
+    services, next_cursor = await svc.list_services(
+        org.id, lifecycle=lifecycle, limit=limit, cursor=cursor
+    )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
     return services
 
 
@@ -3,10 +3,14 @@ Service Catalog business logic.
 Handles slug generation, validation, and orchestration.
 """
 
-import re
+import base64
+import binascii
 import uuid
 
-from app.core.exceptions import ConflictError, NotFoundError
+from sqlalchemy import Row
+
+from app.core.exceptions import ConflictError, NotFoundError, ValidationError
+from app.core.utils import slugify
 from app.services.models import Service
 from app.services.repository import ServiceRepository
 from app.services.schemas import ServiceCreate, ServiceUpdate
@@ -24,12 +28,19 @@ class ServiceService:
         self,
         org_id: uuid.UUID,
         lifecycle: str | None = None,
-    ) -> list[Service]:
-        """List services for an organization."""
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[Row], str | None]:
+        """List a page of services for an organization, plus the next-page cursor."""
         from app.services.models import ServiceLifecycle
 
         lc = ServiceLifecycle(lifecycle) if lifecycle else None
-        return await self.repo.list_by_org(org_id, lifecycle=lc)
+        after = self._decode_cursor(cursor) if cursor else None
+        services, next_key = await self.repo.list_by_org(
+            org_id, lifecycle=lc, limit=limit, after=after
+        )
+        return services, self._encode_cursor(*next_key) if next_key else None
 
     async def get_service(
         self, org_id: uuid.UUID, service_id: uuid.UUID
@@ -74,6 +85,9 @@ class ServiceService:
         service = await self.get_service(org_id, service_id)
 
         update_data = data.model_dump(exclude_unset=True)
+        # Nothing differs from what is stored: skip the flush entirely
+        if all(getattr(service, field) == value for field, value in update_data.items()):
+            return service
 
         # If name changed, regenerate slug
         if "name" in update_data and update_data["name"] != service.name:
@@ -95,22 +109,38 @@ class ServiceService:
 
     # ── Helpers ────────────────────────────────────────────────────
 
+    @staticmethod
+    def _encode_cursor(name: str, service_id: uuid.UUID) -> str:
+        """Opaque page cursor for the (name, id) keyset."""
+        # id first: it never contains the separator, names may
+        raw = f"{service_id}|{name}".encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[str, uuid.UUID]:
+        """Inverse of _encode_cursor; rejects anything it did not produce."""
+        try:
+            service_id, _, name = (
+                base64.urlsafe_b64decode(cursor).decode().partition("|")
+            )
+            return name, uuid.UUID(service_id)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValidationError("Invalid pagination cursor")
+
     @staticmethod
     def _slugify(text: str) -> str:
-        """Convert text to a URL-safe slug."""
-        slug = text.lower().strip()
-        slug = re.sub(r"[^\w\s-]", "", slug)
-        slug = re.sub(r"[\s_]+", "-", slug)
-        slug = re.sub(r"-+", "-", slug)
-        return slug.strip("-")[:100]
+        """Convert text to a URL-safe slug (no leading/trailing hyphens)."""
+        return slugify(text, max_length=None).strip("-")[:100]
 
     async def _ensure_unique_slug(
         self, org_id: uuid.UUID, base_slug: str
     ) -> str:
         """Append a numeric suffix if the slug already exists in this org."""
+        # One query for every candidate, then pick the first free suffix locally
+        taken = await self.repo.list_slugs_with_prefix(org_id, base_slug)
         slug = base_slug
         counter = 1
-        while await self.repo.slug_exists(org_id, slug):
+        while slug in taken:
             slug = f"{base_slug}-{counter}"
             counter += 1
         return slug